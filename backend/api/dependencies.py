@@ -7,11 +7,13 @@ and other shared dependencies with proper cleanup.
 
 import logging
 import time
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Callable, Coroutine, Dict, Optional, Type, TypeVar
 
 import redis.asyncio as aioredis
 import structlog
 from fastapi import Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,6 +23,8 @@ from backend.core.database import get_session
 
 logger = structlog.get_logger(__name__)
 
+JsonBodyModel = TypeVar("JsonBodyModel", bound=BaseModel)
+
 # Redis client for caching and rate limiting
 _redis_client: Optional[aioredis.Redis] = None
 
@@ -266,6 +270,44 @@ def get_search_params(
 
 
 # Request validation dependencies
+def json_body(
+    model: Type[JsonBodyModel]
+) -> Callable[[Request], Coroutine[Any, Any, JsonBodyModel]]:
+    """
+    Build a dependency that validates the raw JSON body with ``model.from_json``.
+    
+    FastAPI's default body handling parses JSON into a dict and then
+    validates it; this parses and validates in a single pydantic-core pass.
+    Validation failures are re-raised as ``RequestValidationError`` so they
+    reach the standard 422 handler.
+    """
+    
+    async def dependency(request: Request) -> JsonBodyModel:
+        raw_body = await request.body()
+        try:
+            return model.from_json(raw_body)
+        except ValidationError as e:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", *error["loc"])}
+                    # Reason: the 422 handler reads only loc and msg
+                    for error in e.errors(include_url=False, include_context=False)
+                ]
+            )
+    
+    return dependency
+
+
+def json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI ``requestBody`` for routes that read their body via ``json_body``."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
 async def validate_content_type(request: Request) -> None:
     """Validate request content type for POST/PUT requests."""
     if request.method in ["POST", "PUT", "PATCH"]:
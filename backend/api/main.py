@@ -23,8 +23,11 @@ from backend.api.dependencies import get_redis_client
 from backend.api.routes import campaigns, consultants, prospects, reports, research
 from backend.core.config import settings
 from backend.core.database import close_database, database_health_check, init_database
-from backend.core.logging import setup_logging
+from backend.core.logging import correlation_id_var, setup_logging
 from backend.core.monitoring import health_check_endpoint, metrics_endpoint
+from backend.models.schemas.consultant import build_deferred_schemas
+from backend.services.openai_service import openai_service
+from backend.services.scraping_service import scraping_service
 from backend.utils.exceptions import (
     ConsultantPlatformException,
     consultant_platform_exception_handler,
@@ -47,6 +50,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting Universal Consultant Intelligence Platform")
     
     try:
+        # Build deferred schemas before serving so no request pays for it
+        build_deferred_schemas()
+        
         # Initialize database
         await init_database()
         logger.info("Database initialized successfully")
@@ -57,6 +63,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             logger.error("Database health check failed")
             raise RuntimeError("Database is not healthy")
         
+        # Open the scraping session once; it is reused by every scrape
+        await scraping_service.startup()
+        
         logger.info("Application startup complete")
         yield
         
@@ -67,6 +76,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Cleanup on shutdown
         logger.info("Shutting down application")
         await close_database()
+        await openai_service.close()
+        await scraping_service.close()
         logger.info("Application shutdown complete")
 
 
@@ -123,6 +134,7 @@ def setup_middleware(app: FastAPI) -> None:
         
         correlation_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
         request.state.correlation_id = correlation_id
+        correlation_id_var.set(correlation_id)
         
         # Add to structured logging context
         structlog.contextvars.clear_contextvars()
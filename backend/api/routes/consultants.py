@@ -16,6 +16,8 @@ from backend.api.dependencies import (
     get_db_session,
     get_pagination_params,
     get_search_params,
+    json_body,
+    json_body_openapi,
     CacheManager,
     PaginationParams,
     SearchParams,
@@ -39,10 +41,11 @@ router = APIRouter()
     response_model=ConsultantResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new consultant profile",
-    description="Create a new consultant profile with signal priorities and preferences."
+    description="Create a new consultant profile with signal priorities and preferences.",
+    openapi_extra=json_body_openapi(ConsultantCreate),
 )
 async def create_consultant(
-    consultant_data: ConsultantCreate,
+    consultant_data: ConsultantCreate = Depends(json_body(ConsultantCreate)),
     db: AsyncSession = Depends(get_db_session),
     cache: CacheManager = Depends(get_cache_manager),
 ) -> ConsultantResponse:
@@ -140,11 +143,12 @@ async def get_consultant(
     "/{consultant_id}",
     response_model=ConsultantResponse,
     summary="Update consultant",
-    description="Update an existing consultant profile."
+    description="Update an existing consultant profile.",
+    openapi_extra=json_body_openapi(ConsultantUpdate),
 )
 async def update_consultant(
     consultant_id: int,
-    consultant_data: ConsultantUpdate,
+    consultant_data: ConsultantUpdate = Depends(json_body(ConsultantUpdate)),
     db: AsyncSession = Depends(get_db_session),
     cache: CacheManager = Depends(get_cache_manager),
 ) -> ConsultantResponse:
@@ -8,7 +8,8 @@ security settings, and service integration parameters.
 from functools import lru_cache
 from typing import List, Optional
 
-from pydantic import BaseSettings, Field, validator
+from pydantic import Field, validator
+from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
@@ -41,6 +42,9 @@ class Settings(BaseSettings):
     openai_temperature: float = Field(0.7, description="OpenAI temperature")
     openai_max_requests_per_minute: int = Field(60, description="Max OpenAI requests per minute")
     openai_max_tokens_per_minute: int = Field(40000, description="Max OpenAI tokens per minute")
+    openai_max_concurrency: int = Field(20, description="Max concurrent in-flight OpenAI requests")
+    openai_embedding_model: str = Field("text-embedding-3-small", description="Embedding model for the semantic response cache")
+    openai_semantic_cache_threshold: float = Field(0.92, description="Min cosine similarity for a semantic cache hit")
     
     # Google Custom Search API
     google_search_api_key: Optional[str] = Field(None, description="Google Search API key")
@@ -91,6 +95,7 @@ class Settings(BaseSettings):
         description="User agent for scraping"
     )
     respect_robots_txt: bool = Field(True, description="Respect robots.txt")
+    scraping_html_parser: str = Field("selectolax", description="HTML parser for scraped pages (selectolax/bs4)")
     
     # Background Tasks
     celery_broker_url: str = Field("redis://localhost:6379/1", description="Celery broker URL")
@@ -123,6 +128,14 @@ class Settings(BaseSettings):
             raise ValueError(f"environment must be one of {allowed_environments}")
         return v
     
+    @validator("scraping_html_parser")
+    def validate_scraping_html_parser(cls, v: str) -> str:
+        """Validate scraping HTML parser value."""
+        allowed_parsers = ["selectolax", "bs4"]
+        if v not in allowed_parsers:
+            raise ValueError(f"scraping_html_parser must be one of {allowed_parsers}")
+        return v
+    
     @validator("log_level")
     def validate_log_level(cls, v: str) -> str:
         """Validate log level value."""
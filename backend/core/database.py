@@ -10,7 +10,7 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from sqlmodel import SQLModel
 
 from backend.core.config import settings
@@ -23,15 +23,21 @@ class DatabaseManager:
     
     def __init__(self) -> None:
         """Initialize database manager with async engine."""
-        # Configure connection pool based on environment
-        poolclass = QueuePool if settings.environment == "production" else NullPool
+        # Configure connection pool based on environment; async engines need
+        # the asyncio-adapted queue pool, and NullPool takes no sizing options
+        if settings.environment == "production":
+            pool_options = {
+                "poolclass": AsyncAdaptedQueuePool,
+                "pool_size": settings.database_pool_size,
+                "max_overflow": settings.database_max_overflow,
+                "pool_timeout": settings.database_pool_timeout,
+            }
+        else:
+            pool_options = {"poolclass": NullPool}
         
         self.engine = create_async_engine(
             settings.database_url,
-            poolclass=poolclass,
-            pool_size=settings.database_pool_size,
-            max_overflow=settings.database_max_overflow,
-            pool_timeout=settings.database_pool_timeout,
+            **pool_options,
             pool_recycle=settings.database_pool_recycle,
             pool_pre_ping=True,  # Validate connections before use
             echo=settings.debug,  # Log SQL queries in debug mode
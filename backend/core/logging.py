@@ -7,17 +7,24 @@ and intelligent filtering for production environments.
 
 import logging
 import sys
-from typing import Any, Dict
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
 
+import orjson
 import structlog
 from structlog.typing import FilteringBoundLogger
 
 from backend.core.config import settings
 
+# Correlation ID of the request being handled; set by the API middleware
+correlation_id_var: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
+
 
 def setup_logging() -> None:
     """Configure structured logging for the application."""
     
+    json_logs = settings.log_format == "json"
+    
     # Configure structlog
     structlog.configure(
         processors=[
@@ -29,11 +36,13 @@ def setup_logging() -> None:
             structlog.processors.StackInfoRenderer(),
             
             # Format for JSON or console output
-            structlog.processors.JSONRenderer() if settings.log_format == "json"
+            structlog.processors.JSONRenderer(serializer=orjson.dumps) if json_logs
             else structlog.dev.ConsoleRenderer(colors=settings.debug),
         ],
         context_class=dict,
-        logger_factory=structlog.WriteLoggerFactory(),
+        # Reason: orjson renders bytes, which only the bytes logger can write
+        logger_factory=structlog.BytesLoggerFactory() if json_logs
+        else structlog.WriteLoggerFactory(),
         wrapper_class=structlog.make_filtering_bound_logger(
             getattr(logging, settings.log_level.upper())
         ),
@@ -114,9 +114,9 @@ class Campaign(SQLModel, table=True):
     follow_up_delay_days: Optional[int] = Field(description="Follow-up delay in days")
     
     # Metadata
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
     updated_at: Optional[datetime] = Field(
         default=None,
@@ -191,9 +191,9 @@ class EmailTemplate(SQLModel, table=True):
     average_reply_rate: Optional[float] = Field(description="Average reply rate")
     
     # Metadata
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
     updated_at: Optional[datetime] = Field(
         default=None,
@@ -278,9 +278,9 @@ class CampaignEmail(SQLModel, table=True):
     next_retry_at: Optional[datetime] = Field(description="Next retry timestamp")
     
     # Metadata
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
     updated_at: Optional[datetime] = Field(
         default=None,
@@ -332,9 +332,9 @@ class EmailEvent(SQLModel, table=True):
     )
     
     # Timestamp
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
     
     # Relationships
@@ -6,7 +6,7 @@ with proper relationships and indexing for optimal query performance.
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy import Column, DateTime, Index, func
 from sqlmodel import Field, Relationship, SQLModel
@@ -52,9 +52,9 @@ class Consultant(ConsultantBase, table=True):
     __tablename__ = "consultants"
     
     id: Optional[int] = Field(default=None, primary_key=True)
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
     updated_at: Optional[datetime] = Field(
         default=None,
@@ -113,9 +113,9 @@ class ConsultantTemplate(SQLModel, table=True):
     # Template metadata
     is_active: bool = Field(default=True, description="Whether template is active")
     version: str = Field(default="1.0", description="Template version")
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
     updated_at: Optional[datetime] = Field(
         default=None,
@@ -152,15 +152,15 @@ class ConsultantPreference(SQLModel, table=True):
     include_executive_summary: bool = Field(default=True, description="Include executive summary")
     
     # Dashboard preferences
-    dashboard_layout: Dict[str, any] = Field(
+    dashboard_layout: Dict[str, Any] = Field(
         default_factory=dict,
         description="Dashboard layout preferences",
         sa_column_kwargs={"type_": "JSON"}
     )
     
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
     updated_at: Optional[datetime] = Field(
         default=None,
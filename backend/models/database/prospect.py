@@ -9,9 +9,26 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 
-from sqlalchemy import Column, DateTime, Index, Text, func
+from sqlalchemy import (
+    ARRAY,
+    DDL,
+    BigInteger,
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    Text,
+    event,
+    func,
+    text,
+)
 from sqlmodel import Field, Relationship, SQLModel
 
+from backend.models.database.types import Score, score_check
+
 
 class CompanySize(str, Enum):
     """Company size enumeration."""
@@ -79,11 +96,6 @@ class Company(SQLModel, table=True):
     linkedin_url: Optional[str] = Field(max_length=500, description="LinkedIn URL")
     twitter_handle: Optional[str] = Field(max_length=100, description="Twitter handle")
     
-    # Company metrics and scores
-    overall_score: Optional[float] = Field(default=0.0, description="Overall prospect score")
-    signal_count: int = Field(default=0, description="Number of signals detected")
-    last_signal_date: Optional[datetime] = Field(description="Date of last signal")
-    
     # Search optimization
     search_vector: Optional[str] = Field(
         sa_column=Column("search_vector", "tsvector"),
@@ -92,9 +104,9 @@ class Company(SQLModel, table=True):
     
     # Metadata
     is_active: bool = Field(default=True, description="Whether company is active")
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
     updated_at: Optional[datetime] = Field(
         default=None,
@@ -114,17 +126,102 @@ class Company(SQLModel, table=True):
         back_populates="company",
         cascade_delete=True
     )
+    summary: Optional["CompanySummary"] = Relationship(
+        back_populates="company",
+        sa_relationship_kwargs={"uselist": False},
+        cascade_delete=True
+    )
     
     __table_args__ = (
         Index("idx_company_name_domain", "name", "domain"),
         Index("idx_company_industry_size", "industry", "size"),
         Index("idx_company_location", "headquarters_country", "headquarters_city"),
-        Index("idx_company_score_signals", "overall_score", "signal_count"),
         Index("idx_company_search", "search_vector", postgresql_using="gin"),
-        Index("idx_company_active_updated", "is_active", "updated_at"),
+        Index("idx_company_updated_active", "updated_at", postgresql_where=text("is_active")),
+    )
+
+
+class CompanySummary(SQLModel, table=True):
+    """Narrow, frequently read company metrics kept apart from the wide profile row.
+    
+    Ranked and paginated company lists only need a handful of columns, so they
+    live in their own table and stay cache-resident. ``name``, ``industry`` and
+    ``size`` are copies maintained from ``companies`` by a trigger; join back to
+    ``Company`` only when profile fields are needed.
+    """
+    
+    __tablename__ = "company_summaries"
+    
+    company_id: int = Field(
+        foreign_key="companies.id",
+        primary_key=True,
+        description="Summarised company"
+    )
+    
+    # Denormalized listing fields (synced from companies)
+    name: str = Field(max_length=200, description="Company name")
+    industry: Optional[str] = Field(max_length=100, description="Industry")
+    size: Optional[CompanySize] = Field(description="Company size category")
+    
+    # Company metrics and scores
+    overall_score: Optional[float] = Field(
+        default=0.0,
+        sa_column=Column(Score),
+        description="Overall prospect score (0.0-1.0)"
+    )
+    signal_count: int = Field(default=0, description="Number of signals detected")
+    last_signal_date: Optional[datetime] = Field(description="Date of last signal")
+    
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), onupdate=func.now())
+    )
+    
+    # Relationships
+    company: Company = Relationship(back_populates="summary")
+    
+    __table_args__ = (
+        score_check("overall_score", "ck_company_summary_overall_score"),
+        CheckConstraint("signal_count >= 0", name="ck_company_summary_signal_count"),
+        Index("idx_company_summary_score_signals", "overall_score", "signal_count"),
+        Index("idx_company_summary_industry_size", "industry", "size"),
     )
 
 
+# Reason: asyncpg runs one statement per execute, so the function and the
+# trigger are registered as separate DDL events.
+event.listen(
+    CompanySummary.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION sync_company_summary() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO company_summaries (company_id, name, industry, size)
+            VALUES (NEW.id, NEW.name, NEW.industry, NEW.size)
+            ON CONFLICT (company_id) DO UPDATE
+                SET name = EXCLUDED.name,
+                    industry = EXCLUDED.industry,
+                    size = EXCLUDED.size;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    CompanySummary.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE TRIGGER trg_company_summary_sync
+        AFTER INSERT OR UPDATE OF name, industry, size ON companies
+        FOR EACH ROW EXECUTE FUNCTION sync_company_summary()
+        """
+    ).execute_if(dialect="postgresql"),
+)
+
+
 class Executive(SQLModel, table=True):
     """Executive and key personnel information."""
     
@@ -161,16 +258,20 @@ class Executive(SQLModel, table=True):
     )
     
     # Engagement tracking
-    engagement_score: Optional[float] = Field(default=0.0, description="Engagement score")
+    engagement_score: Optional[float] = Field(
+        default=0.0,
+        sa_column=Column(Score),
+        description="Engagement score (0.0-1.0)"
+    )
     last_activity_date: Optional[datetime] = Field(description="Last activity date")
     contact_attempts: int = Field(default=0, description="Number of contact attempts")
     
     # Metadata
     is_primary_contact: bool = Field(default=False, description="Primary contact for company")
     is_active: bool = Field(default=True, description="Whether executive is active")
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
     updated_at: Optional[datetime] = Field(
         default=None,
@@ -181,10 +282,15 @@ class Executive(SQLModel, table=True):
     company: Company = Relationship(back_populates="executives")
     
     __table_args__ = (
+        score_check("engagement_score", "ck_executive_engagement_score"),
         Index("idx_executive_company_name", "company_id", "full_name"),
         Index("idx_executive_title_department", "title", "department"),
         Index("idx_executive_email", "email"),
-        Index("idx_executive_primary_active", "is_primary_contact", "is_active"),
+        Index(
+            "idx_executive_primary_active",
+            "company_id",
+            postgresql_where=text("is_primary_contact AND is_active"),
+        ),
     )
 
 
@@ -193,7 +299,10 @@ class Signal(SQLModel, table=True):
     
     __tablename__ = "signals"
     
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger, Identity(always=False), primary_key=True)
+    )
     company_id: int = Field(foreign_key="companies.id", index=True)
     
     # Signal identification
@@ -202,9 +311,18 @@ class Signal(SQLModel, table=True):
     description: str = Field(sa_column=Column(Text), description="Signal description")
     
     # Signal metadata
-    confidence_score: float = Field(description="AI confidence score (0.0-1.0)")
-    relevance_score: float = Field(description="Relevance score for consultant (0.0-1.0)")
-    impact_score: float = Field(description="Potential business impact (0.0-1.0)")
+    confidence_score: float = Field(
+        sa_column=Column(Score, nullable=False),
+        description="AI confidence score (0.0-1.0)"
+    )
+    relevance_score: float = Field(
+        sa_column=Column(Score, nullable=False),
+        description="Relevance score for consultant (0.0-1.0)"
+    )
+    impact_score: float = Field(
+        sa_column=Column(Score, nullable=False),
+        description="Potential business impact (0.0-1.0)"
+    )
     
     # Source information
     source_url: Optional[str] = Field(max_length=1000, description="Source URL")
@@ -225,7 +343,7 @@ class Signal(SQLModel, table=True):
     keywords: Optional[List[str]] = Field(
         default_factory=list,
         description="Extracted keywords",
-        sa_column_kwargs={"type_": "JSON"}
+        sa_column=Column(ARRAY(Text))
     )
     
     # Validation and status
@@ -234,9 +352,9 @@ class Signal(SQLModel, table=True):
     validation_notes: Optional[str] = Field(description="Validation notes")
     
     # Metadata
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
     expires_at: Optional[datetime] = Field(description="Signal expiration date")
     
@@ -244,12 +362,87 @@ class Signal(SQLModel, table=True):
     company: Company = Relationship(back_populates="signals")
     
     __table_args__ = (
+        score_check("confidence_score", "ck_signal_confidence_score"),
+        score_check("relevance_score", "ck_signal_relevance_score"),
+        score_check("impact_score", "ck_signal_impact_score"),
         Index("idx_signal_company_type", "company_id", "signal_type"),
         Index("idx_signal_scores", "confidence_score", "relevance_score", "impact_score"),
         Index("idx_signal_source_date", "source_date"),
-        Index("idx_signal_validated_actionable", "is_validated", "is_actionable"),
-        Index("idx_signal_created", "created_at"),
+        Index(
+            "idx_signal_unvalidated",
+            "company_id",
+            "created_at",
+            postgresql_where=text("NOT is_validated AND is_actionable"),
+        ),
+        Index(
+            "idx_signal_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
+
+class SignalKeyword(SQLModel, table=True):
+    """Inverted index of signal keywords for exact-match filtering.
+    
+    Mirrors ``Signal.keywords`` one row per keyword so "signals mentioning X"
+    is a B-tree range scan on ``(keyword, signal_id)``. Maintained by a trigger
+    on ``signals``; the array column stays the source of truth for display.
+    Filter through this table rather than array containment on ``keywords``,
+    which has no index of its own.
+    """
+    
+    __tablename__ = "signal_keywords"
+    
+    signal_id: int = Field(
+        sa_column=Column(
+            BigInteger,
+            ForeignKey("signals.id", ondelete="CASCADE"),
+            primary_key=True
+        )
+    )
+    # Reason: Text, like the ARRAY(Text) source column, so no keyword the
+    # signal accepts can make the trigger abort the signal write
+    keyword: str = Field(
+        sa_column=Column(Text, primary_key=True),
+        description="Signal keyword"
     )
+    
+    __table_args__ = (
+        Index("idx_sig_kw_keyword_signal", "keyword", "signal_id"),
+    )
+
+
+event.listen(
+    SignalKeyword.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION sync_signal_keywords() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM signal_keywords WHERE signal_id = NEW.id;
+            INSERT INTO signal_keywords (signal_id, keyword)
+            SELECT DISTINCT NEW.id, kw
+            FROM unnest(NEW.keywords) AS kw
+            WHERE kw IS NOT NULL;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    SignalKeyword.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE TRIGGER trg_signal_keywords_sync
+        AFTER INSERT OR UPDATE OF keywords ON signals
+        FOR EACH ROW EXECUTE FUNCTION sync_signal_keywords()
+        """
+    ).execute_if(dialect="postgresql"),
+)
 
 
 class Prospect(SQLModel, table=True):
@@ -264,7 +457,11 @@ class Prospect(SQLModel, table=True):
     # Prospect metadata
     status: ProspectStatus = Field(default=ProspectStatus.NEW, description="Prospect status", index=True)
     priority: int = Field(default=3, description="Priority (1-5, 1=highest)")
-    overall_score: float = Field(default=0.0, description="Overall prospect score")
+    overall_score: float = Field(
+        default=0.0,
+        sa_column=Column(Score, nullable=False),
+        description="Overall prospect score (0.0-1.0)"
+    )
     
     # Tracking information
     first_contact_date: Optional[datetime] = Field(description="Date of first contact")
@@ -279,17 +476,17 @@ class Prospect(SQLModel, table=True):
     key_insights: Optional[List[str]] = Field(
         default_factory=list,
         description="Key insights about the prospect",
-        sa_column_kwargs={"type_": "JSON"}
+        sa_column=Column(ARRAY(Text))
     )
     pain_points: Optional[List[str]] = Field(
         default_factory=list,
         description="Identified pain points",
-        sa_column_kwargs={"type_": "JSON"}
+        sa_column=Column(ARRAY(Text))
     )
     opportunities: Optional[List[str]] = Field(
         default_factory=list,
         description="Identified opportunities",
-        sa_column_kwargs={"type_": "JSON"}
+        sa_column=Column(ARRAY(Text))
     )
     
     # Engagement tracking
@@ -303,14 +500,14 @@ class Prospect(SQLModel, table=True):
     tags: Optional[List[str]] = Field(
         default_factory=list,
         description="Prospect tags",
-        sa_column_kwargs={"type_": "JSON"}
+        sa_column=Column(ARRAY(Text))
     )
     
     # Metadata
     is_active: bool = Field(default=True, description="Whether prospect is active")
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
     updated_at: Optional[datetime] = Field(
         default=None,
@@ -322,9 +519,74 @@ class Prospect(SQLModel, table=True):
     company: Company = Relationship(back_populates="prospects")
     
     __table_args__ = (
-        Index("idx_prospect_consultant_status", "consultant_id", "status"),
+        score_check("overall_score", "ck_prospect_overall_score"),
+        CheckConstraint("priority BETWEEN 1 AND 5", name="ck_prospect_priority"),
+        Index(
+            "idx_prospect_consultant_status",
+            "consultant_id",
+            "status",
+            postgresql_include=["overall_score", "priority", "next_follow_up"],
+        ),
         Index("idx_prospect_company", "company_id"),
         Index("idx_prospect_score_priority", "overall_score", "priority"),
         Index("idx_prospect_follow_up", "next_follow_up"),
-        Index("idx_prospect_active_updated", "is_active", "updated_at"),
-    )
\ No newline at end of file
+        Index("idx_prospect_updated_active", "updated_at", postgresql_where=text("is_active")),
+        {"postgresql_with": {"fillfactor": 70}},
+    )
+
+
+class ProspectTag(SQLModel, table=True):
+    """Inverted index of prospect tags for exact-match filtering.
+    
+    Mirrors ``Prospect.tags`` one row per tag and is maintained by a trigger
+    on ``prospects``, the same way ``SignalKeyword`` mirrors signal keywords.
+    """
+    
+    __tablename__ = "prospect_tags"
+    
+    prospect_id: int = Field(
+        sa_column=Column(
+            Integer,
+            ForeignKey("prospects.id", ondelete="CASCADE"),
+            primary_key=True
+        )
+    )
+    tag: str = Field(
+        sa_column=Column(Text, primary_key=True),
+        description="Prospect tag"
+    )
+    
+    __table_args__ = (
+        Index("idx_prospect_tag_tag_prospect", "tag", "prospect_id"),
+    )
+
+
+event.listen(
+    ProspectTag.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION sync_prospect_tags() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM prospect_tags WHERE prospect_id = NEW.id;
+            INSERT INTO prospect_tags (prospect_id, tag)
+            SELECT DISTINCT NEW.id, t
+            FROM unnest(NEW.tags) AS t
+            WHERE t IS NOT NULL;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    ProspectTag.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE TRIGGER trg_prospect_tags_sync
+        AFTER INSERT OR UPDATE OF tags ON prospects
+        FOR EACH ROW EXECUTE FUNCTION sync_prospect_tags()
+        """
+    ).execute_if(dialect="postgresql"),
+)
@@ -9,9 +9,22 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import Column, DateTime, Index, Text, func
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Identity,
+    Index,
+    Text,
+    func,
+)
 from sqlmodel import Field, Relationship, SQLModel
 
+from backend.models.database.types import Score, score_check
+
 
 class TaskStatus(str, Enum):
     """Research task status enumeration."""
@@ -94,7 +107,7 @@ class ResearchTask(SQLModel, table=True):
     output_files: Optional[List[str]] = Field(
         default_factory=list,
         description="Generated output files",
-        sa_column_kwargs={"type_": "JSON"}
+        sa_column=Column(ARRAY(Text))
     )
     
     # Error handling
@@ -116,9 +129,9 @@ class ResearchTask(SQLModel, table=True):
     estimated_cost: Optional[float] = Field(description="Estimated cost in USD")
     
     # Metadata
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
     updated_at: Optional[datetime] = Field(
         default=None,
@@ -132,12 +145,16 @@ class ResearchTask(SQLModel, table=True):
         cascade_delete=True
     )
     
+    # Reason: progress_percentage, current_step and updated_at change on every
+    # progress tick. Keeping them out of all indexes (including INCLUDE lists)
+    # lets those updates stay heap-only (HOT) within the fillfactor headroom.
     __table_args__ = (
+        CheckConstraint("progress_percentage BETWEEN 0 AND 100", name="ck_task_progress_percentage"),
         Index("idx_task_consultant_status", "consultant_id", "status"),
         Index("idx_task_type_priority", "task_type", "priority"),
         Index("idx_task_created_status", "created_at", "status"),
         Index("idx_task_company_target", "target_company", "target_domain"),
-        Index("idx_task_progress", "progress_percentage"),
+        {"postgresql_with": {"fillfactor": 70}},
     )
 
 
@@ -146,7 +163,10 @@ class ResearchResult(SQLModel, table=True):
     
     __tablename__ = "research_results"
     
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger, Identity(always=False), primary_key=True)
+    )
     research_task_id: int = Field(foreign_key="research_tasks.id", index=True)
     
     # Result identification
@@ -162,15 +182,24 @@ class ResearchResult(SQLModel, table=True):
     )
     
     # Quality metrics
-    confidence_score: Optional[float] = Field(description="AI confidence score (0.0-1.0)")
-    relevance_score: Optional[float] = Field(description="Relevance score (0.0-1.0)")
-    quality_score: Optional[float] = Field(description="Overall quality score (0.0-1.0)")
+    confidence_score: Optional[float] = Field(
+        sa_column=Column(Score),
+        description="AI confidence score (0.0-1.0)"
+    )
+    relevance_score: Optional[float] = Field(
+        sa_column=Column(Score),
+        description="Relevance score (0.0-1.0)"
+    )
+    quality_score: Optional[float] = Field(
+        sa_column=Column(Score),
+        description="Overall quality score (0.0-1.0)"
+    )
     
     # Source attribution
     source_urls: Optional[List[str]] = Field(
         default_factory=list,
         description="Source URLs for the result",
-        sa_column_kwargs={"type_": "JSON"}
+        sa_column=Column(ARRAY(Text))
     )
     source_metadata: Optional[Dict[str, Any]] = Field(
         default_factory=dict,
@@ -188,19 +217,27 @@ class ResearchResult(SQLModel, table=True):
     last_viewed_at: Optional[datetime] = Field(description="Last view timestamp")
     
     # Metadata
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
     
     # Relationships
     research_task: ResearchTask = Relationship(back_populates="research_results")
     
     __table_args__ = (
+        score_check("confidence_score", "ck_result_confidence_score"),
+        score_check("relevance_score", "ck_result_relevance_score"),
+        score_check("quality_score", "ck_result_quality_score"),
         Index("idx_result_task_type", "research_task_id", "result_type"),
         Index("idx_result_scores", "confidence_score", "relevance_score", "quality_score"),
         Index("idx_result_validated", "is_validated", "manual_review_required"),
-        Index("idx_result_created", "created_at"),
+        Index(
+            "idx_result_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
 
@@ -209,7 +246,10 @@ class ResearchAuditLog(SQLModel, table=True):
     
     __tablename__ = "research_audit_logs"
     
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger, Identity(always=False), primary_key=True)
+    )
     
     # Audit identification
     entity_type: str = Field(max_length=50, description="Type of entity changed", index=True)
@@ -219,6 +259,56 @@ class ResearchAuditLog(SQLModel, table=True):
     # User and session tracking
     user_id: Optional[int] = Field(description="User who performed the action")
     session_id: Optional[str] = Field(max_length=100, description="Session identifier")
+    
+    # Change tracking (payloads live in ResearchAuditLogDetail)
+    changes_summary: Optional[str] = Field(description="Summary of changes made")
+    
+    # Metadata
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+    
+    # Relationships
+    detail: Optional["ResearchAuditLogDetail"] = Relationship(
+        back_populates="audit_log",
+        sa_relationship_kwargs={"uselist": False, "lazy": "raise"},
+        cascade_delete=True
+    )
+    
+    __table_args__ = (
+        Index("idx_audit_entity", "entity_type", "entity_id"),
+        Index(
+            "idx_audit_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index("idx_audit_user", "user_id"),
+        Index("idx_audit_session", "session_id"),
+    )
+
+
+class ResearchAuditLogDetail(SQLModel, table=True):
+    """Cold request metadata and change payloads for an audit log entry.
+    
+    Kept 1:1 with ``ResearchAuditLog`` so audit listings filtered by entity or
+    user read narrow rows; load this only when the change detail is requested,
+    with an explicit ``selectinload(ResearchAuditLog.detail)``.
+    """
+    
+    __tablename__ = "research_audit_log_details"
+    
+    audit_log_id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(
+            BigInteger,
+            ForeignKey("research_audit_logs.id", ondelete="CASCADE"),
+            primary_key=True
+        )
+    )
+    
+    # Request metadata
     ip_address: Optional[str] = Field(max_length=45, description="IP address")
     user_agent: Optional[str] = Field(max_length=500, description="User agent string")
     
@@ -233,7 +323,6 @@ class ResearchAuditLog(SQLModel, table=True):
         description="New values",
         sa_column_kwargs={"type_": "JSON"}
     )
-    changes_summary: Optional[str] = Field(description="Summary of changes made")
     
     # Context information
     context_data: Optional[Dict[str, Any]] = Field(
@@ -242,18 +331,8 @@ class ResearchAuditLog(SQLModel, table=True):
         sa_column_kwargs={"type_": "JSON"}
     )
     
-    # Metadata
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
-    )
-    
-    __table_args__ = (
-        Index("idx_audit_entity", "entity_type", "entity_id"),
-        Index("idx_audit_action_created", "action", "created_at"),
-        Index("idx_audit_user", "user_id"),
-        Index("idx_audit_session", "session_id"),
-    )
+    # Relationships
+    audit_log: ResearchAuditLog = Relationship(back_populates="detail")
 
 
 class ResearchMetrics(SQLModel, table=True):
@@ -290,9 +369,9 @@ class ResearchMetrics(SQLModel, table=True):
     reports_generated: int = Field(default=0, description="Reports generated")
     
     # Metadata
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
     
     __table_args__ = (
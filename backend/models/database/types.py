@@ -0,0 +1,43 @@
+"""
+Custom column types for the Universal Consultant Intelligence Platform.
+
+Defines compact storage types and matching constraints shared
+across the database models.
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy import CheckConstraint, SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+# Fixed-point scale for 0.0-1.0 scores: 4 decimal places fit in a SMALLINT.
+SCORE_SCALE = 10000
+
+
+class Score(TypeDecorator):
+    """0.0-1.0 score stored as a 2-byte SMALLINT fixed-point value.
+
+    Python code reads and writes plain floats; the column holds
+    ``round(value * SCORE_SCALE)``. Raw SQL against these columns must use
+    the scaled integer range (0-10000).
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[float], dialect: Any) -> Optional[int]:
+        """Scale a float score to its stored integer."""
+        if value is None:
+            return None
+        return round(value * SCORE_SCALE)
+
+    def process_result_value(self, value: Optional[int], dialect: Any) -> Optional[float]:
+        """Scale a stored integer back to a float score."""
+        if value is None:
+            return None
+        return value / SCORE_SCALE
+
+
+def score_check(column: str, name: str) -> CheckConstraint:
+    """Build a CHECK constraint bounding a ``Score`` column to 0.0-1.0."""
+    return CheckConstraint(f"{column} BETWEEN 0 AND {SCORE_SCALE}", name=name)
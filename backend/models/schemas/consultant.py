@@ -6,9 +6,96 @@ with comprehensive input validation and type safety.
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Annotated, Any, Callable, Dict, List, Optional, Type, TypeVar
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+_ALLOWED_CONSULTANT_TYPES = frozenset({
+    'fractional_cmo', 'fractional_cfo', 'fractional_coo', 'fractional_cto',
+    'sales_consultant', 'marketing_consultant', 'strategy_consultant',
+    'operations_consultant', 'hr_consultant', 'it_consultant',
+    'finance_consultant', 'legal_consultant', 'product_consultant',
+    'business_coach', 'executive_coach', 'digital_transformation'
+})
+_ALLOWED_SIZES = frozenset({'startup', 'small', 'medium', 'large', 'enterprise'})
+_ALLOWED_FREQUENCIES = frozenset({'hourly', 'daily', 'weekly', 'monthly'})
+_ALLOWED_FORMATS = frozenset({'pdf', 'html', 'docx', 'email'})
+
+_CONSULTANT_TYPE_ERR = f'consultant_type must be one of: {", ".join(sorted(_ALLOWED_CONSULTANT_TYPES))}'
+_SIZE_ERR = f'target_company_size must be one of: {", ".join(sorted(_ALLOWED_SIZES))}'
+_FREQUENCY_ERR = f'research_frequency must be one of: {", ".join(sorted(_ALLOWED_FREQUENCIES))}'
+_FORMAT_ERR = f'report_format must be one of: {", ".join(sorted(_ALLOWED_FORMATS))}'
+
+
+def _make_enum_check(allowed: frozenset, message: str) -> Callable[[str], str]:
+    """
+    Build a case-insensitive membership validator for a fixed set of values.
+    
+    Args:
+        allowed: Lowercase values accepted for the field.
+        message: Precomputed error message raised on a miss.
+        
+    Returns:
+        Validator returning the lowercase value.
+    """
+    
+    def check(v: str) -> str:
+        # Reason: test the raw value first so the common already-lowercase
+        # input is accepted without allocating a lowered copy.
+        if v in allowed:
+            return v
+        lowered = v.lower()
+        if lowered not in allowed:
+            raise ValueError(message)
+        return lowered
+    
+    return check
+
+
+def _clean_list(v: List[str]) -> List[str]:
+    """Validate and clean list fields."""
+    # Reason: strip each item once and bind append locally; bulk imports can
+    # carry long industry lists.
+    cleaned: List[str] = []
+    append = cleaned.append
+    for item in v:
+        stripped = item.strip()
+        if stripped:
+            append(stripped)
+    return cleaned
+
+
+# Shared constrained types: one validator per constraint, reused by the
+# create, update and preference schemas.
+ConsultantTypeStr = Annotated[str, AfterValidator(_make_enum_check(_ALLOWED_CONSULTANT_TYPES, _CONSULTANT_TYPE_ERR))]
+CompanySizeStr = Annotated[str, AfterValidator(_make_enum_check(_ALLOWED_SIZES, _SIZE_ERR))]
+ResearchFrequencyStr = Annotated[str, AfterValidator(_make_enum_check(_ALLOWED_FREQUENCIES, _FREQUENCY_ERR))]
+ReportFormatStr = Annotated[str, AfterValidator(_make_enum_check(_ALLOWED_FORMATS, _FORMAT_ERR))]
+SignalPriority = Annotated[float, Field(ge=0.0, le=1.0)]
+SignalPriorities = Dict[str, SignalPriority]
+CleanStrList = Annotated[List[str], AfterValidator(_clean_list)]
+
+RequestModel = TypeVar("RequestModel", bound=BaseModel)
+
+
+class JsonInputMixin:
+    """Single-pass JSON parsing and validation for request schemas."""
+    
+    @classmethod
+    def from_json(cls: Type[RequestModel], raw: bytes) -> RequestModel:
+        """
+        Parse and validate a raw JSON request body in one pydantic-core pass.
+        
+        Args:
+            raw: Request body bytes.
+            
+        Returns:
+            The validated schema instance.
+            
+        Raises:
+            pydantic.ValidationError: If the body is not valid JSON or fails validation.
+        """
+        return cls.model_validate_json(raw)
 
 
 class ConsultantBase(BaseModel):
@@ -20,21 +107,21 @@ class ConsultantBase(BaseModel):
         max_length=100,
         description="Consultant name"
     )
-    consultant_type: str = Field(
+    consultant_type: ConsultantTypeStr = Field(
         ..., 
         min_length=1, 
         max_length=50,
         description="Type of consultant (e.g., 'fractional_cmo', 'sales_consultant')"
     )
-    industry_focus: List[str] = Field(
+    industry_focus: CleanStrList = Field(
         default_factory=list,
         description="Industries the consultant focuses on"
     )
-    target_company_size: str = Field(
+    target_company_size: CompanySizeStr = Field(
         ...,
         description="Target company size (startup, small, medium, large)"
     )
-    geographic_preference: List[str] = Field(
+    geographic_preference: CleanStrList = Field(
         default_factory=list,
         description="Preferred geographic regions"
     )
@@ -43,7 +130,7 @@ class ConsultantBase(BaseModel):
         min_length=10,
         description="How the consultant positions their solutions"
     )
-    signal_priorities: Dict[str, float] = Field(
+    signal_priorities: SignalPriorities = Field(
         default_factory=dict,
         description="Weighted priorities for different signals (0.0-1.0)"
     )
@@ -51,60 +138,17 @@ class ConsultantBase(BaseModel):
         default=True,
         description="Whether consultant profile is active"
     )
+    
+    # Reason: whitespace is stripped in pydantic-core before min_length runs,
+    # so blank names/positioning are rejected without a Python validator.
+    model_config = ConfigDict(str_strip_whitespace=True)
 
 
-class ConsultantCreate(ConsultantBase):
+class ConsultantCreate(ConsultantBase, JsonInputMixin):
     """Schema for creating a new consultant."""
-    
-    @field_validator('name', 'solution_positioning')
-    @classmethod
-    def validate_non_empty_string(cls, v: str) -> str:
-        """Validate that string fields are not empty after stripping."""
-        if not v.strip():
-            raise ValueError('Field cannot be empty')
-        return v.strip()
-    
-    @field_validator('consultant_type')
-    @classmethod
-    def validate_consultant_type(cls, v: str) -> str:
-        """Validate consultant type format."""
-        allowed_types = {
-            'fractional_cmo', 'fractional_cfo', 'fractional_coo', 'fractional_cto',
-            'sales_consultant', 'marketing_consultant', 'strategy_consultant',
-            'operations_consultant', 'hr_consultant', 'it_consultant',
-            'finance_consultant', 'legal_consultant', 'product_consultant',
-            'business_coach', 'executive_coach', 'digital_transformation'
-        }
-        if v.lower() not in allowed_types:
-            raise ValueError(f'consultant_type must be one of: {", ".join(sorted(allowed_types))}')
-        return v.lower()
-    
-    @field_validator('target_company_size')
-    @classmethod
-    def validate_company_size(cls, v: str) -> str:
-        """Validate target company size."""
-        allowed_sizes = {'startup', 'small', 'medium', 'large', 'enterprise'}
-        if v.lower() not in allowed_sizes:
-            raise ValueError(f'target_company_size must be one of: {", ".join(sorted(allowed_sizes))}')
-        return v.lower()
-    
-    @field_validator('signal_priorities')
-    @classmethod
-    def validate_signal_priorities(cls, v: Dict[str, float]) -> Dict[str, float]:
-        """Validate signal priorities are between 0.0 and 1.0."""
-        for signal_type, priority in v.items():
-            if not 0.0 <= priority <= 1.0:
-                raise ValueError(f'Signal priority for {signal_type} must be between 0.0 and 1.0')
-        return v
-    
-    @field_validator('industry_focus', 'geographic_preference')
-    @classmethod
-    def validate_list_fields(cls, v: List[str]) -> List[str]:
-        """Validate and clean list fields."""
-        return [item.strip() for item in v if item.strip()]
 
 
-class ConsultantUpdate(BaseModel):
+class ConsultantUpdate(BaseModel, JsonInputMixin):
     """Schema for updating a consultant."""
     
     name: Optional[str] = Field(
@@ -113,21 +157,21 @@ class ConsultantUpdate(BaseModel):
         max_length=100,
         description="Consultant name"
     )
-    consultant_type: Optional[str] = Field(
+    consultant_type: Optional[ConsultantTypeStr] = Field(
         None,
         min_length=1,
         max_length=50,
         description="Type of consultant"
     )
-    industry_focus: Optional[List[str]] = Field(
+    industry_focus: Optional[CleanStrList] = Field(
         None,
         description="Industries the consultant focuses on"
     )
-    target_company_size: Optional[str] = Field(
+    target_company_size: Optional[CompanySizeStr] = Field(
         None,
         description="Target company size"
     )
-    geographic_preference: Optional[List[str]] = Field(
+    geographic_preference: Optional[CleanStrList] = Field(
         None,
         description="Preferred geographic regions"
     )
@@ -136,7 +180,7 @@ class ConsultantUpdate(BaseModel):
         min_length=10,
         description="How the consultant positions their solutions"
     )
-    signal_priorities: Optional[Dict[str, float]] = Field(
+    signal_priorities: Optional[SignalPriorities] = Field(
         None,
         description="Weighted priorities for different signals"
     )
@@ -145,23 +189,7 @@ class ConsultantUpdate(BaseModel):
         description="Whether consultant profile is active"
     )
     
-    @field_validator('name', 'solution_positioning')
-    @classmethod
-    def validate_non_empty_strings(cls, v: Optional[str]) -> Optional[str]:
-        """Validate that string fields are not empty after stripping."""
-        if v is not None and not v.strip():
-            raise ValueError('Field cannot be empty')
-        return v.strip() if v else v
-    
-    @field_validator('signal_priorities')
-    @classmethod
-    def validate_signal_priorities(cls, v: Optional[Dict[str, float]]) -> Optional[Dict[str, float]]:
-        """Validate signal priorities are between 0.0 and 1.0."""
-        if v is not None:
-            for signal_type, priority in v.items():
-                if not 0.0 <= priority <= 1.0:
-                    raise ValueError(f'Signal priority for {signal_type} must be between 0.0 and 1.0')
-        return v
+    model_config = ConfigDict(str_strip_whitespace=True)
 
 
 class ConsultantResponse(ConsultantBase):
@@ -171,8 +199,7 @@ class ConsultantResponse(ConsultantBase):
     created_at: datetime = Field(description="Creation timestamp")
     updated_at: Optional[datetime] = Field(description="Last update timestamp")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
 
 
 class ConsultantListResponse(BaseModel):
@@ -196,15 +223,14 @@ class ConsultantTemplateResponse(BaseModel):
     description: str = Field(description="Template description")
     default_industry_focus: List[str] = Field(description="Default industry focus")
     default_target_company_size: str = Field(description="Default target company size")
-    default_signal_priorities: Dict[str, float] = Field(description="Default signal priorities")
+    default_signal_priorities: SignalPriorities = Field(description="Default signal priorities")
     signal_patterns: Dict[str, Dict] = Field(description="Signal detection patterns")
     is_active: bool = Field(description="Whether template is active")
     version: str = Field(description="Template version")
     created_at: datetime = Field(description="Creation timestamp")
     updated_at: Optional[datetime] = Field(description="Last update timestamp")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore', defer_build=True)
 
 
 class ConsultantPreferenceResponse(BaseModel):
@@ -221,12 +247,11 @@ class ConsultantPreferenceResponse(BaseModel):
     report_format: str = Field(description="Preferred report format")
     include_charts: bool = Field(description="Include charts in reports")
     include_executive_summary: bool = Field(description="Include executive summary")
-    dashboard_layout: Dict[str, any] = Field(description="Dashboard layout preferences")
+    dashboard_layout: Dict[str, Any] = Field(description="Dashboard layout preferences")
     created_at: datetime = Field(description="Creation timestamp")
     updated_at: Optional[datetime] = Field(description="Last update timestamp")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore', defer_build=True)
 
 
 class ConsultantPreferenceUpdate(BaseModel):
@@ -236,34 +261,14 @@ class ConsultantPreferenceUpdate(BaseModel):
     research_completion_alerts: Optional[bool] = Field(None, description="Alert on research completion")
     weekly_digest: Optional[bool] = Field(None, description="Send weekly digest")
     auto_research_enabled: Optional[bool] = Field(None, description="Enable automatic research")
-    research_frequency: Optional[str] = Field(None, description="Research frequency")
+    research_frequency: Optional[ResearchFrequencyStr] = Field(None, description="Research frequency")
     max_prospects_per_day: Optional[int] = Field(None, ge=1, le=100, description="Max prospects to research per day")
-    report_format: Optional[str] = Field(None, description="Preferred report format")
+    report_format: Optional[ReportFormatStr] = Field(None, description="Preferred report format")
     include_charts: Optional[bool] = Field(None, description="Include charts in reports")
     include_executive_summary: Optional[bool] = Field(None, description="Include executive summary")
-    dashboard_layout: Optional[Dict[str, any]] = Field(None, description="Dashboard layout preferences")
+    dashboard_layout: Optional[Dict[str, Any]] = Field(None, description="Dashboard layout preferences")
     
-    @field_validator('research_frequency')
-    @classmethod
-    def validate_research_frequency(cls, v: Optional[str]) -> Optional[str]:
-        """Validate research frequency."""
-        if v is not None:
-            allowed_frequencies = {'hourly', 'daily', 'weekly', 'monthly'}
-            if v.lower() not in allowed_frequencies:
-                raise ValueError(f'research_frequency must be one of: {", ".join(sorted(allowed_frequencies))}')
-            return v.lower()
-        return v
-    
-    @field_validator('report_format')
-    @classmethod
-    def validate_report_format(cls, v: Optional[str]) -> Optional[str]:
-        """Validate report format."""
-        if v is not None:
-            allowed_formats = {'pdf', 'html', 'docx', 'email'}
-            if v.lower() not in allowed_formats:
-                raise ValueError(f'report_format must be one of: {", ".join(sorted(allowed_formats))}')
-            return v.lower()
-        return v
+    model_config = ConfigDict(defer_build=True)
 
 
 class ConsultantStats(BaseModel):
@@ -281,6 +286,10 @@ class ConsultantStats(BaseModel):
     average_prospect_score: Optional[float] = Field(description="Average prospect score")
     conversion_rate: Optional[float] = Field(description="Conversion rate percentage")
     response_rate: Optional[float] = Field(description="Email response rate percentage")
+    
+    # Reason: stats are computed server-side, so skip lax coercion. Convert
+    # SQL aggregates (AVG returns Decimal) to float before building this.
+    model_config = ConfigDict(strict=True)
 
 
 class ConsultantDashboard(BaseModel):
@@ -292,4 +301,21 @@ class ConsultantDashboard(BaseModel):
     recent_signals: List[Dict] = Field(description="Recent signals")
     active_campaigns: List[Dict] = Field(description="Active campaigns")
     upcoming_tasks: List[Dict] = Field(description="Upcoming tasks")
-    performance_metrics: Dict[str, any] = Field(description="Performance metrics")
\ No newline at end of file
+    performance_metrics: Dict[str, Any] = Field(description="Performance metrics")
+
+
+# Schemas with no route bound to them yet: their core schemas are built by
+# build_deferred_schemas() at API startup, so other importers (workers,
+# scripts) never pay for them.
+DEFERRED_SCHEMAS = (
+    ConsultantTemplateResponse,
+    ConsultantPreferenceResponse,
+    ConsultantPreferenceUpdate,
+)
+
+
+def build_deferred_schemas() -> None:
+    """Build the core schemas of every ``defer_build`` model up front."""
+    for schema in DEFERRED_SCHEMAS:
+        schema.model_rebuild(force=True)
+
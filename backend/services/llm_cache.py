@@ -0,0 +1,154 @@
+"""
+LLM response caching for the Universal Consultant Intelligence Platform.
+
+Provides in-process exact-match and semantic caches, so repeated research
+and signal analysis calls can skip the chat completion entirely.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import orjson
+
+
+class ExactCache:
+    """
+    Exact-match response cache keyed on a SHA-256 of the full request.
+    
+    Only suitable for low-temperature calls, where identical inputs give
+    effectively identical outputs.
+    """
+    
+    def __init__(self, max_entries: int = 4096, ttl_seconds: int = 86400):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        scope: Optional[str] = None
+    ) -> str:
+        """
+        Hash the request parameters that determine the response.
+        
+        ``scope`` mixes in an identity the messages themselves may not carry,
+        such as the company a semantic-cache namespace is limited to.
+        """
+        payload = orjson.dumps(
+            {"m": model, "msgs": messages, "t": temperature, "mt": max_tokens, "s": scope},
+            option=orjson.OPT_SORT_KEYS
+        )
+        return hashlib.sha256(payload).hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the live cached value for a key, if any."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class _Bucket:
+    """Cached entries sharing one namespace (model + system prompt + params)."""
+    
+    def __init__(self, dimensions: int):
+        self.matrix = np.empty((0, dimensions), dtype=np.float32)
+        self.values: List[Any] = []
+        self.expires_at: List[float] = []
+
+
+class SemanticCache:
+    """
+    Cosine-similarity cache over L2-normalized prompt embeddings.
+    
+    Entries are grouped by namespace so a prompt only matches prompts sent
+    with the same model, system prompt and sampling parameters.
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 1024,
+        ttl_seconds: int = 86400
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._buckets: Dict[str, _Bucket] = {}
+    
+    @staticmethod
+    def normalize(embedding: List[float]) -> np.ndarray:
+        """Convert a raw embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    def lookup(self, namespace: str, vector: np.ndarray) -> Optional[Any]:
+        """
+        Return the cached value for the most similar live prompt, if any.
+        
+        Args:
+            namespace: Cache namespace for the request
+            vector: Normalized prompt embedding
+        
+        Returns:
+            Cached value when the best match meets the threshold, else None.
+        """
+        bucket = self._buckets.get(namespace)
+        if bucket is None or not bucket.values:
+            return None
+        
+        # Unit vectors, so the dot product is the cosine similarity
+        scores = bucket.matrix @ vector
+        scores[np.asarray(bucket.expires_at) < time.monotonic()] = -1.0
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        return bucket.values[best]
+    
+    def insert(self, namespace: str, vector: np.ndarray, value: Any) -> None:
+        """
+        Store a value under a prompt embedding.
+        
+        Expired entries are pruned first, then the oldest entries are dropped
+        once the namespace exceeds ``max_entries``.
+        
+        Args:
+            namespace: Cache namespace for the request
+            vector: Normalized prompt embedding
+            value: Value to return on future matches
+        """
+        now = time.monotonic()
+        bucket = self._buckets.get(namespace)
+        if bucket is None:
+            bucket = self._buckets[namespace] = _Bucket(vector.shape[0])
+        
+        keep = [i for i, expires in enumerate(bucket.expires_at) if expires >= now]
+        keep = keep[-(self.max_entries - 1):] if self.max_entries > 1 else []
+        if len(keep) != len(bucket.values):
+            bucket.matrix = bucket.matrix[keep]
+            bucket.values = [bucket.values[i] for i in keep]
+            bucket.expires_at = [bucket.expires_at[i] for i in keep]
+        
+        bucket.matrix = np.vstack([bucket.matrix, vector[np.newaxis, :]])
+        bucket.values.append(value)
+        bucket.expires_at.append(now + self.ttl_seconds)
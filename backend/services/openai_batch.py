@@ -0,0 +1,161 @@
+"""
+OpenAI Batch API helpers for the Universal Consultant Intelligence Platform.
+
+Encodes chat completion requests as JSONL, submits them as a batch, polls
+it to completion and reads back the per-request output records.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Tuple
+
+import httpx
+import orjson
+import structlog
+from openai import AsyncOpenAI
+from openai.types import CompletionUsage
+
+from backend.services.openai_prompts import build_research_messages
+from backend.services.openai_schemas import (
+    RESEARCH_RESPONSE_FORMAT,
+    ResearchBatchJob,
+    ResearchSummary,
+    parse_research_response,
+)
+
+logger = structlog.get_logger(__name__)
+
+# OpenAI Batch API jobs are billed at half the synchronous token price
+BATCH_COST_MULTIPLIER = 0.5
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def chat_request_line(custom_id: str, body: Dict[str, Any]) -> bytes:
+    """Encode one chat completion request as a Batch API JSONL line."""
+    return orjson.dumps({
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": body
+    })
+
+
+async def run_chat_batch(
+    client: AsyncOpenAI,
+    filename: str,
+    lines: List[bytes],
+    poll_interval: float
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Run chat completion requests through the Batch API and wait for the output.
+    
+    Args:
+        client: OpenAI client to submit and poll with
+        filename: Name for the uploaded JSONL input file
+        lines: Request lines built with ``chat_request_line``
+        poll_interval: Seconds between batch status checks
+    
+    Returns:
+        The batch ID and its output records, one per request.
+    
+    Raises:
+        RuntimeError: If the batch ends in any status other than completed.
+    """
+    
+    input_file = await client.files.create(
+        file=(filename, b"\n".join(lines)),
+        purpose="batch"
+    )
+    
+    # Reason: the pinned SDK predates client.batches, so use its
+    # low-level request helpers against the same endpoints.
+    batch = (await client.post(
+        "/batches",
+        body={
+            "input_file_id": input_file.id,
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h"
+        },
+        cast_to=httpx.Response
+    )).json()
+    
+    logger.info("OpenAI batch submitted", batch_id=batch["id"], requests=len(lines))
+    
+    while batch["status"] not in BATCH_TERMINAL_STATUSES:
+        await asyncio.sleep(poll_interval)
+        batch = (await client.get(
+            f"/batches/{batch['id']}",
+            cast_to=httpx.Response
+        )).json()
+    
+    if batch["status"] != "completed":
+        raise RuntimeError(f"batch {batch['id']} ended with status {batch['status']}")
+    
+    output = await client.files.content(batch["output_file_id"])
+    return batch["id"], [orjson.loads(line) for line in output.text.splitlines() if line]
+
+
+async def run_research_batch(
+    client: AsyncOpenAI,
+    model: str,
+    jobs: List[ResearchBatchJob],
+    poll_interval: float
+) -> Tuple[str, Dict[str, ResearchSummary], CompletionUsage]:
+    """
+    Synthesize research for many companies in one batch.
+    
+    Args:
+        client: OpenAI client to submit and poll with
+        model: Model to run every research request on
+        jobs: Research requests, each with a unique ``custom_id``
+        poll_interval: Seconds between batch status checks
+    
+    Returns:
+        The batch ID, a ResearchSummary per ``custom_id`` (jobs that failed
+        inside the batch are logged and omitted) and the summed token usage.
+    """
+    
+    sources_count = {job.custom_id: len(job.raw_data) for job in jobs}
+    lines = [
+        chat_request_line(job.custom_id, {
+            "model": model,
+            "messages": build_research_messages(
+                job.consultant_profile,
+                job.raw_data,
+                job.target_company,
+                job.research_objectives
+            ),
+            "temperature": 0.3,
+            "max_tokens": 2000,
+            "response_format": RESEARCH_RESPONSE_FORMAT
+        })
+        for job in jobs
+    ]
+    batch_id, records = await run_chat_batch(client, "research_batch.jsonl", lines, poll_interval)
+    
+    results = {}
+    prompt_tokens = 0
+    completion_tokens = 0
+    for record in records:
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            logger.warning(
+                "Research batch job failed",
+                custom_id=record.get("custom_id"),
+                error=record.get("error")
+            )
+            continue
+        
+        body = response["body"]
+        usage = body.get("usage", {})
+        prompt_tokens += usage.get("prompt_tokens", 0)
+        completion_tokens += usage.get("completion_tokens", 0)
+        results[record["custom_id"]] = parse_research_response(
+            body["choices"][0]["message"]["content"],
+            sources_count.get(record["custom_id"], 0)
+        )
+    
+    return batch_id, results, CompletionUsage(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens
+    )
@@ -0,0 +1,310 @@
+"""
+Chat completion client for the Universal Consultant Intelligence Platform.
+
+Wraps the OpenAI SDK with a concurrency cap, jittered retries, exact-match
+and semantic response caches, and coalescing of identical in-flight
+requests.
+"""
+
+import asyncio
+import random
+from typing import Any, Dict, List, Optional
+
+import httpx
+import numpy as np
+import openai
+import structlog
+from openai import AsyncOpenAI, AsyncStream
+
+from backend.core.config import settings
+from backend.services.llm_cache import ExactCache, SemanticCache
+from backend.services.openai_tokens import output_token_budget
+
+logger = structlog.get_logger(__name__)
+
+# Upper bound on any single retry sleep, including server Retry-After hints
+MAX_BACKOFF_SECONDS = 60.0
+
+# Calls at or below this temperature are treated as deterministic and served
+# from the exact-match cache; creative calls (email generation) never are.
+EXACT_CACHE_MAX_TEMPERATURE = 0.3
+
+
+class _LeaderCancelled(Exception):
+    """Set on a coalesced request when the caller that sent it was cancelled."""
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float,
+    error: Optional[openai.APIStatusError] = None
+) -> float:
+    """
+    Jittered exponential backoff, stretched to any server Retry-After hint.
+    
+    Randomizing the sleep keeps concurrent workers that failed together
+    from retrying in lockstep.
+    
+    Args:
+        attempt: Zero-based retry attempt
+        base_delay: Lower bound of the first attempt's delay, in seconds
+        error: Failed response, whose Retry-After headers are honoured
+    
+    Returns:
+        Seconds to sleep, at most ``MAX_BACKOFF_SECONDS``.
+    """
+    wait_time = random.uniform(base_delay, base_delay * 3 * (2 ** attempt))
+    
+    headers = error.response.headers if error is not None else {}
+    retry_after = None
+    try:
+        if "retry-after-ms" in headers:
+            retry_after = float(headers["retry-after-ms"]) / 1000
+        elif "retry-after" in headers:
+            retry_after = float(headers["retry-after"])
+    except ValueError:
+        # HTTP-date form; fall back to the computed backoff
+        pass
+    if retry_after is not None:
+        wait_time = max(wait_time, retry_after)
+    
+    return min(wait_time, MAX_BACKOFF_SECONDS)
+
+
+class ChatCompletionClient:
+    """Rate-limited, retrying and cached access to chat completions."""
+    
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        max_concurrency: int,
+        semantic_cache_threshold: float,
+        max_retries: int = 5,
+        retry_delay: float = 1.0
+    ):
+        self.client = client
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        # Reason: caps in-flight requests so batch fan-out stays under the
+        # account's rate limits instead of tripping RateLimitError retries.
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._exact_cache = ExactCache()
+        self._semantic_cache = SemanticCache(threshold=semantic_cache_threshold)
+        # Exact-cache key -> result of the identical request already in flight
+        self._inflight: Dict[str, asyncio.Future] = {}
+    
+    async def complete(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.5,
+        max_tokens: int = 1000,
+        timeout: int = 30,
+        response_format: Optional[Dict[str, Any]] = None,
+        semantic_cache_scope: Optional[str] = None
+    ) -> Any:
+        """
+        Make OpenAI API call with exponential backoff retry logic.
+        
+        With ``semantic_cache_scope`` set to the company the prompt is about,
+        the final user message is embedded and a near-duplicate earlier
+        prompt for the same company (same model, system prompt and
+        parameters) returns its stored response without a chat completion.
+        ``max_tokens`` is clamped to what fits in the model's context window
+        after the measured prompt. Calls at or below
+        ``EXACT_CACHE_MAX_TEMPERATURE`` are first checked
+        against an exact-match cache of identical requests, and an identical
+        request already in flight is awaited instead of sent again; if the
+        caller that sent it is cancelled, a waiting caller re-sends it. Cached
+        and coalesced responses carry ``usage=None`` so callers record no
+        tokens.
+        """
+        
+        max_tokens = output_token_budget(model, messages, max_tokens)
+        
+        if temperature > EXACT_CACHE_MAX_TEMPERATURE:
+            return await self._fetch_completion(
+                model, messages, temperature, max_tokens, timeout, response_format,
+                semantic_cache_scope
+            )
+        
+        exact_key = ExactCache.make_key(model, messages, temperature, max_tokens)
+        cached = self._exact_cache.get(exact_key)
+        if cached is not None:
+            logger.debug("OpenAI exact cache hit", model=model)
+            return cached
+        
+        while (inflight := self._inflight.get(exact_key)) is not None:
+            logger.debug("OpenAI request coalesced", model=model)
+            try:
+                # Reason: a cancelled follower must not cancel the shared request
+                return await asyncio.shield(inflight)
+            except _LeaderCancelled:
+                # Only the leader's caller went away; the first follower to
+                # wake takes over the request and the rest coalesce onto it
+                continue
+        
+        inflight = self._inflight[exact_key] = asyncio.get_running_loop().create_future()
+        try:
+            response = await self._fetch_completion(
+                model, messages, temperature, max_tokens, timeout, response_format,
+                semantic_cache_scope, exact_key
+            )
+        except asyncio.CancelledError:
+            # Reason: cancelling the shared future would cancel every follower
+            # too, although none of them was cancelled
+            inflight.set_exception(_LeaderCancelled())
+            inflight.exception()
+            raise
+        except Exception as e:
+            inflight.set_exception(e)
+            # Mark retrieved so an unawaited future doesn't log a warning
+            inflight.exception()
+            raise
+        finally:
+            self._inflight.pop(exact_key, None)
+        
+        inflight.set_result(response.model_copy(update={"usage": None}))
+        return response
+    
+    async def open_stream(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        timeout: int,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> AsyncStream:
+        """
+        Open a streaming chat completion, without retries or caching.
+        
+        A concurrency slot is held only while the stream is opened, so a slow
+        consumer can't keep one for the whole response. The caller must close
+        ``stream.response`` when done.
+        """
+        
+        async with self._semaphore:
+            return await self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=output_token_budget(model, messages, max_tokens),
+                timeout=timeout,
+                stream=True,
+                **({"response_format": response_format} if response_format else {})
+            )
+    
+    async def _fetch_completion(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        timeout: int,
+        response_format: Optional[Dict[str, Any]],
+        semantic_cache_scope: Optional[str],
+        exact_key: Optional[str] = None
+    ) -> Any:
+        """
+        Serve a chat completion from the semantic cache or the API.
+        
+        Successful API responses are stored under ``exact_key`` when given
+        and in the semantic cache when a scope is given.
+        """
+        
+        cache_namespace = None
+        prompt_vector = None
+        if semantic_cache_scope:
+            # Reason: the company is only named in the embedded user message,
+            # so similar prompts about different companies could otherwise
+            # match; the scope keeps each company's entries apart.
+            cache_namespace = ExactCache.make_key(
+                model, messages[:-1], temperature, max_tokens, scope=semantic_cache_scope
+            )
+            prompt_vector = await self._embed(messages[-1]["content"])
+            if prompt_vector is not None:
+                cached = self._semantic_cache.lookup(cache_namespace, prompt_vector)
+                if cached is not None:
+                    logger.debug("OpenAI semantic cache hit", model=model)
+                    return cached
+        
+        for attempt in range(self.max_retries):
+            try:
+                # Hold a slot only for the request itself, not the backoff sleep
+                async with self._semaphore:
+                    response = await self.client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        timeout=timeout,
+                        # Reason: the pinned SDK doesn't export NOT_GIVEN, so
+                        # leave the argument out entirely when unset
+                        **({"response_format": response_format} if response_format else {})
+                    )
+                
+                if exact_key is not None or prompt_vector is not None:
+                    cached_response = response.model_copy(update={"usage": None})
+                    if exact_key is not None:
+                        self._exact_cache.set(exact_key, cached_response)
+                    if prompt_vector is not None:
+                        self._semantic_cache.insert(cache_namespace, prompt_vector, cached_response)
+                
+                return response
+            
+            except openai.RateLimitError as e:
+                if attempt < self.max_retries - 1:
+                    wait_time = backoff_delay(attempt, self.retry_delay, e)
+                    logger.warning(
+                        f"OpenAI rate limit hit, retrying in {wait_time:.2f}s",
+                        attempt=attempt + 1,
+                        max_retries=self.max_retries
+                    )
+                    await asyncio.sleep(wait_time)
+                    continue
+                raise
+            
+            except (openai.APITimeoutError, openai.APIConnectionError, httpx.TimeoutException) as e:
+                if attempt < self.max_retries - 1:
+                    wait_time = backoff_delay(attempt, self.retry_delay)
+                    logger.warning(
+                        f"OpenAI connection error, retrying in {wait_time:.2f}s",
+                        attempt=attempt + 1,
+                        error=str(e)
+                    )
+                    await asyncio.sleep(wait_time)
+                    continue
+                raise
+            
+            except openai.APIStatusError as e:
+                if attempt < self.max_retries - 1 and e.status_code >= 500:
+                    wait_time = backoff_delay(attempt, self.retry_delay, e)
+                    logger.warning(
+                        f"OpenAI server error, retrying in {wait_time:.2f}s",
+                        attempt=attempt + 1,
+                        error=str(e)
+                    )
+                    await asyncio.sleep(wait_time)
+                    continue
+                raise
+            
+            except Exception as e:
+                logger.error(f"OpenAI API call failed: {e}")
+                raise
+    
+    async def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed a prompt for the semantic cache; None if embedding fails."""
+        
+        try:
+            async with self._semaphore:
+                response = await self.client.embeddings.create(
+                    model=settings.openai_embedding_model,
+                    input=text
+                )
+        except openai.OpenAIError as e:
+            # Reason: the cache is an optimization; never fail the call over it
+            logger.warning("Prompt embedding failed, skipping semantic cache", error=str(e))
+            return None
+        
+        return SemanticCache.normalize(response.data[0].embedding)
@@ -0,0 +1,316 @@
+"""
+Prompt construction for the Universal Consultant Intelligence Platform's OpenAI calls.
+
+Holds the shared system prompt preambles, the per-consultant prompt
+builders and the message lists sent for research synthesis, signal
+analysis and email generation.
+"""
+
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List
+
+
+# Hard bounds on prompt input so token usage stays predictable whatever the
+# scrapers return: items and characters per item, a total character budget
+# for the research data block (~3000 tokens), and a cap on signal content.
+MAX_RESEARCH_ITEMS = 10
+MAX_RESEARCH_ITEM_CHARS = 200
+MAX_PROMPT_CHARS = 12000
+MAX_SIGNAL_CONTENT_CHARS = 4000
+
+
+def _format_research_data(raw_data: List[Dict[str, Any]]) -> str:
+    """Render raw research items into a prompt block within ``MAX_PROMPT_CHARS``."""
+    lines = []
+    used = 0
+    for item in islice(raw_data, MAX_RESEARCH_ITEMS):
+        content = str(item.get('content', ''))[:MAX_RESEARCH_ITEM_CHARS]
+        line = f"- {item.get('type', 'Unknown')}: {content}..."
+        if used + len(line) > MAX_PROMPT_CHARS:
+            break
+        lines.append(line)
+        used += len(line) + 1
+    
+    omitted = len(raw_data) - len(lines)
+    if omitted:
+        lines.append(f"(truncated, {omitted} omitted)")
+    return "\n".join(lines)
+
+
+_RESEARCH_USER_TEMPLATE = """Please analyze the following research data for {company}:
+
+RESEARCH OBJECTIVES:
+{objectives}
+
+RAW DATA SOURCES ({total} total):
+{data}
+
+Keep the executive summary to 2-3 sentences and list 3-5 key findings. Prioritize business signals
+by impact, make recommended actions specific next steps, and base the confidence score (0.0-1.0)
+on data quality.
+
+Focus on insights that directly support business development and client engagement opportunities."""
+
+
+def _as_prompt_text(value: Any) -> str:
+    """Render a profile value for a prompt; sequences and dict keys are comma-joined."""
+    if isinstance(value, (list, tuple, set, frozenset, dict)):
+        return ', '.join(str(item) for item in value)
+    return str(value)
+
+
+# Each system prompt opens with a long module-level preamble that is identical
+# for every consultant, and the consultant-specific context goes last. OpenAI
+# caches prompt prefixes of 1024+ tokens automatically, so repeat calls reuse
+# the preamble at a discount instead of diverging on the first line.
+_RESEARCH_SYS_PREFIX = """You are an expert business intelligence analyst supporting independent consultants and
+consulting firms. Your role is to synthesize raw research data about a single target company into
+actionable insights for business development and client engagement.
+
+ANALYSIS FRAMEWORK
+Work through the research data in this order before writing any output:
+1. Source review: read every data item and note its type (news article, press release, job posting,
+   financial filing, social media post, company website content, industry report). Weigh primary
+   sources (filings, official announcements, the company's own site) above secondary commentary.
+2. Fact extraction: pull out concrete, verifiable facts such as leadership changes, funding rounds,
+   acquisitions, product launches, market expansion, restructuring, layoffs, hiring waves, regulatory
+   events, partnerships, technology adoption and reported financial performance. Ignore boilerplate,
+   marketing slogans and content that does not describe the target company.
+3. Signal identification: decide which facts indicate a change in the company's situation that could
+   create demand for outside expertise. Typical signals are growth that strains existing processes,
+   new leadership reshaping strategy, transformation or modernization programs, compliance pressure,
+   integration work after a merger, cost-reduction mandates and expansion into new markets.
+4. Relevance filtering: rank signals against the consultant context given at the end of this prompt.
+   A signal outside the consultant's focus areas, target company size or geography should rank low
+   even when it is newsworthy in general.
+5. Opportunity framing: for the strongest signals, work out what problem the company is likely
+   facing, who inside the company probably owns it, and why now is a good time to engage.
+6. Confidence assessment: judge how far the conclusions are supported by the data provided.
+
+OUTPUT GUIDANCE
+- executive_summary: 2-3 sentences stating the company's current situation and the single most
+  important engagement opportunity. No preamble, no hedging phrases, no restating the request.
+- key_findings: 3-5 short, specific, factual statements drawn from the data. Each finding should
+  stand on its own and cite concrete details (names, figures, dates) where the data contains them.
+- business_signals: one entry per distinct signal, most important first. "type" is a short category
+  label such as "leadership_change", "funding", "expansion", "hiring", "technology_adoption",
+  "regulatory", "restructuring" or "partnership". "description" is one sentence explaining the
+  signal and why it matters to the consultant. "impact" is "high" when the signal points to a
+  near-term, well-funded initiative in the consultant's focus areas, "medium" when it is relevant
+  but less urgent or less certain, and "low" otherwise. "confidence" is 0.0-1.0 and reflects how
+  directly the data supports the signal.
+- recommended_actions: concrete next steps the consultant can take this week, such as who to contact,
+  which angle to lead with and what supporting material to prepare. Avoid generic advice like
+  "build a relationship" or "monitor the company".
+- confidence_score: 0.0-1.0 for the summary as a whole. Use 0.8 or higher only when several
+  independent, recent, primary sources agree. Use 0.5 or lower when the data is sparse, stale,
+  contradictory or mostly second-hand.
+- sources_analyzed: the number of data items you reviewed.
+
+RULES
+- Base every statement on the research data provided. Never invent facts, people, figures or events.
+- When the data is thin, say so through lower confidence values rather than speculating.
+- Prefer specific, recent information over general background about the industry.
+- Keep the language plain and professional; the output is read by busy consultants between meetings.
+- Be concise, data-driven, and focus on insights that directly support business development
+  activities."""
+
+
+_SIGNAL_SYS_PREFIX = """You are a business signal analysis expert. Your role is to evaluate individual business
+signals for their relevance, priority, and potential impact based on consultant priorities.
+
+ASSESSMENT FRAMEWORK
+For each signal, assess:
+1. Business impact and relevance: what changes for the company because of this event, how large the
+   change is, and how closely it maps to the consultant's priority areas given at the end of this
+   prompt.
+2. Timing and urgency: whether the window to act is open now, opening soon or already closing.
+   Announcements of new initiatives, fresh funding and new leadership usually open a window of
+   weeks to a few months; completed projects and old news usually close it.
+3. Actionability and next steps: whether there is a clear person, team or initiative to approach and
+   a credible reason to reach out.
+4. Priority score (0.0-1.0): combine relevance, impact and timing. Reserve scores above 0.8 for
+   signals that are highly relevant, significant and time-sensitive. Score signals outside the
+   priority areas below 0.4 even if they are significant for the company.
+5. Connection to other signals: related events in the company context that strengthen or weaken the
+   reading of this signal.
+
+OUTPUT GUIDANCE
+- signal_type: a short category label such as "leadership_change", "funding", "expansion", "hiring",
+  "technology_adoption", "regulatory", "restructuring" or "partnership".
+- priority_score: the 0.0-1.0 score described above.
+- business_impact: one or two sentences on what the signal means for the company's needs.
+- timing_relevance: one sentence on how urgent engagement is and why.
+- action_recommendations: 2-4 specific next steps for the consultant.
+- related_signals: short descriptions of connected signals from the context; empty when there are none.
+
+RULES
+- Base the assessment only on the signal and company context provided; never invent details.
+- Be objective, data-driven, and focus on practical business implications."""
+
+
+_EMAIL_SYS_PREFIX = """You are an expert email copywriter writing first-touch business development emails on behalf of
+consultants. The consultant's background and preferred communication style are given at the end of
+this prompt.
+
+Create compelling, personalized emails that:
+1. Capture attention with relevant insights
+2. Demonstrate expertise and value
+3. Include clear call-to-action
+4. Maintain professional tone
+5. Are concise and actionable
+
+OUTPUT GUIDANCE
+- subject: under 60 characters, specific to the prospect, no clickbait, no all-caps, no emoji.
+- body: under 150 words. Open with a prospect-specific observation drawn from the research, connect it
+  to a problem the consultant solves, offer one concrete point of value, and close with the call to
+  action. Use short paragraphs and plain text without markdown.
+- tone: the communication style used.
+- personalization_points: the prospect-specific facts the email relies on.
+- call_to_action: a single low-friction ask, such as a short call at a proposed time.
+
+Avoid generic templates and focus on personalization based on prospect research. Never invent facts
+about the prospect or claim results the consultant has not provided."""
+
+
+# Only the consultant context varies, so it is cached per profile and
+# appended after the shared preamble.
+@lru_cache(maxsize=256)
+def _research_system_prompt(
+    consultant_type: str,
+    industry_focus: str,
+    focus_areas: str,
+    target_company_size: str,
+    geographic_preference: str
+) -> str:
+    """Research synthesis system prompt for one consultant profile."""
+    return f"""{_RESEARCH_SYS_PREFIX}
+
+Consultant context:
+- Consultant type: {consultant_type}
+- Industry focus: {industry_focus}
+- Focus areas: {focus_areas}
+- Target company size: {target_company_size}
+- Geographic preference: {geographic_preference}"""
+
+
+@lru_cache(maxsize=256)
+def _signal_analysis_system_prompt(priority_areas: str) -> str:
+    """Signal analysis system prompt for one set of priority areas."""
+    return f"""{_SIGNAL_SYS_PREFIX}
+
+Consultant context:
+- Priority areas: {priority_areas}"""
+
+
+@lru_cache(maxsize=256)
+def _email_generation_system_prompt(
+    consultant_type: str,
+    industry_focus: str,
+    solution_positioning: str,
+    template_style: str
+) -> str:
+    """Email generation system prompt for one consultant profile and style."""
+    return f"""{_EMAIL_SYS_PREFIX}
+
+Consultant context:
+- Consultant type: {consultant_type}
+- Industry focus: {industry_focus}
+- Solution positioning: {solution_positioning}
+- Communication style: {template_style}"""
+
+
+def build_research_messages(
+    consultant_profile: Dict[str, Any],
+    raw_data: List[Dict[str, Any]],
+    target_company: str,
+    research_objectives: List[str]
+) -> List[Dict[str, str]]:
+    """Build the system and user messages for research synthesis."""
+    get = consultant_profile.get
+    system_prompt = _research_system_prompt(
+        _as_prompt_text(get('consultant_type', 'consultant')),
+        _as_prompt_text(get('industry_focus', 'business')),
+        _as_prompt_text(get('signal_priorities', [])),
+        _as_prompt_text(get('target_company_size', 'all sizes')),
+        _as_prompt_text(get('geographic_preference', 'global'))
+    )
+    user_prompt = _RESEARCH_USER_TEMPLATE.format(
+        company=target_company,
+        objectives="\n".join(f"- {obj}" for obj in research_objectives),
+        total=len(raw_data),
+        data=_format_research_data(raw_data)
+    )
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+def build_signal_analysis_messages(
+    consultant_priorities: List[str],
+    signal_data: Dict[str, Any],
+    company_context: Dict[str, Any]
+) -> List[Dict[str, str]]:
+    """Build the system and user messages for signal analysis."""
+    signal = signal_data.get
+    company = company_context.get
+    user_prompt = f"""Analyze this business signal:
+
+SIGNAL DATA:
+Type: {signal('type', 'Unknown')}
+Content: {str(signal('content', ''))[:MAX_SIGNAL_CONTENT_CHARS]}
+Source: {signal('source', 'Unknown')}
+Date: {signal('date', 'Unknown')}
+
+COMPANY CONTEXT:
+Name: {company('name', 'Unknown')}
+Industry: {company('industry', 'Unknown')}
+Size: {company('size', 'Unknown')}
+Background: {company('description', 'Unknown')}
+
+Give the priority score on a 0.0-1.0 scale."""
+    return [
+        {
+            "role": "system",
+            "content": _signal_analysis_system_prompt(_as_prompt_text(consultant_priorities))
+        },
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+def build_email_generation_messages(
+    consultant_profile: Dict[str, Any],
+    template_style: str,
+    prospect_data: Dict[str, Any],
+    email_objective: str
+) -> List[Dict[str, str]]:
+    """Build the system and user messages for email generation."""
+    profile = consultant_profile.get
+    prospect = prospect_data.get
+    system_prompt = _email_generation_system_prompt(
+        _as_prompt_text(profile('consultant_type', 'consultant')),
+        _as_prompt_text(profile('industry_focus', 'business')),
+        _as_prompt_text(profile('solution_positioning', 'value creation')),
+        template_style
+    )
+    user_prompt = f"""Generate a personalized email for this prospect:
+
+PROSPECT INFORMATION:
+Name: {prospect('name', 'Unknown')}
+Title: {prospect('title', 'Unknown')}
+Company: {prospect('company', 'Unknown')}
+Industry: {prospect('industry', 'Unknown')}
+Recent activity: {prospect('recent_signals', 'None available')}
+
+EMAIL OBJECTIVE: {email_objective}
+
+Make the subject line compelling and specific, the body personalized and value-focused, and the
+call to action clear. List the personalization points you used.
+
+Keep the email concise (under 150 words) and professional."""
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
@@ -0,0 +1,105 @@
+"""
+OpenAI structured-output schemas for the Universal Consultant Intelligence Platform.
+
+Defines the Pydantic models the chat completions must return and the
+``response_format`` payloads built from them.
+"""
+
+from typing import Any, Dict, List, Literal, Type
+
+from pydantic import BaseModel, ConfigDict
+
+
+# Output models are frozen and closed: model_json_schema() then emits
+# additionalProperties=false everywhere, as strict structured outputs require.
+_OUTPUT_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
+
+class BusinessSignal(BaseModel):
+    """One business signal identified during research synthesis."""
+    
+    model_config = _OUTPUT_MODEL_CONFIG
+    
+    type: str
+    description: str
+    impact: Literal["low", "medium", "high"]
+    confidence: float
+
+
+class ResearchSummary(BaseModel):
+    """Research synthesis output model."""
+    
+    model_config = _OUTPUT_MODEL_CONFIG
+    
+    executive_summary: str
+    key_findings: List[str]
+    business_signals: List[BusinessSignal]
+    recommended_actions: List[str]
+    confidence_score: float
+    sources_analyzed: int
+
+
+class SignalAnalysis(BaseModel):
+    """Signal analysis output model."""
+    
+    model_config = _OUTPUT_MODEL_CONFIG
+    
+    signal_type: str
+    priority_score: float
+    business_impact: str
+    timing_relevance: str
+    action_recommendations: List[str]
+    related_signals: List[str]
+
+
+class ResearchBatchJob(BaseModel):
+    """One research synthesis request submitted through the Batch API."""
+    
+    custom_id: str
+    raw_data: List[Dict[str, Any]]
+    consultant_profile: Dict[str, Any]
+    target_company: str
+    research_objectives: List[str]
+
+
+class EmailContent(BaseModel):
+    """Email generation output model."""
+    
+    model_config = _OUTPUT_MODEL_CONFIG
+    
+    subject: str
+    body: str
+    tone: str
+    personalization_points: List[str]
+    call_to_action: str
+
+
+def _json_schema_format(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Build a structured-output ``response_format`` from a Pydantic model."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": model.__name__,
+            "schema": model.model_json_schema(),
+            "strict": True
+        }
+    }
+
+
+# Built once: the model emits JSON matching these and the parsers validate it
+RESEARCH_RESPONSE_FORMAT = _json_schema_format(ResearchSummary)
+SIGNAL_RESPONSE_FORMAT = _json_schema_format(SignalAnalysis)
+EMAIL_RESPONSE_FORMAT = _json_schema_format(EmailContent)
+
+
+def parse_research_response(response: str, sources_count: int) -> ResearchSummary:
+    """Validate a structured research synthesis response."""
+    summary = ResearchSummary.model_validate_json(response)
+    # Reason: the source count is known locally; don't trust the model's
+    return summary.model_copy(update={"sources_analyzed": sources_count})
+
+
+def parse_email_content(response: str, tone: str) -> EmailContent:
+    """Validate a structured email generation response."""
+    email = EmailContent.model_validate_json(response)
+    return email.model_copy(update={"tone": tone})
@@ -2,74 +2,72 @@
 OpenAI service for the Universal Consultant Intelligence Platform.
 
 Provides AI-powered research synthesis, content analysis, signal prioritization,
-and intelligent email generation using GPT-4 and GPT-3.5-turbo models.
+and intelligent email generation using GPT-4o-family structured outputs.
 """
 
 import asyncio
-import time
-from typing import Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
-import openai
+import httpx
 import structlog
 from openai import AsyncOpenAI
-from pydantic import BaseModel
+from openai.types import CompletionUsage
 
 from backend.core.config import settings
-from backend.core.logging import performance_logger
-from backend.core.monitoring import record_openai_metrics
+from backend.services.openai_batch import BATCH_COST_MULTIPLIER, run_research_batch
+from backend.services.openai_client import ChatCompletionClient
+from backend.services.openai_prompts import (
+    build_email_generation_messages,
+    build_research_messages,
+    build_signal_analysis_messages,
+)
+from backend.services.openai_schemas import (
+    EMAIL_RESPONSE_FORMAT,
+    RESEARCH_RESPONSE_FORMAT,
+    SIGNAL_RESPONSE_FORMAT,
+    EmailContent,
+    ResearchBatchJob,
+    ResearchSummary,
+    SignalAnalysis,
+    parse_email_content,
+    parse_research_response,
+)
+from backend.services.openai_tokens import count_prompt_tokens, encoder_for, record_call_metrics
+from backend.services.openai_transport import AiohttpTransport
 from backend.utils.exceptions import raise_external_service_error
 
 logger = structlog.get_logger(__name__)
 
 
-class ResearchSummary(BaseModel):
-    """Research synthesis output model."""
-    
-    executive_summary: str
-    key_findings: List[str]
-    business_signals: List[Dict[str, any]]
-    recommended_actions: List[str]
-    confidence_score: float
-    sources_analyzed: int
-
-
-class SignalAnalysis(BaseModel):
-    """Signal analysis output model."""
-    
-    signal_type: str
-    priority_score: float
-    business_impact: str
-    timing_relevance: str
-    action_recommendations: List[str]
-    related_signals: List[str]
-
-
-class EmailContent(BaseModel):
-    """Email generation output model."""
-    
-    subject: str
-    body: str
-    tone: str
-    personalization_points: List[str]
-    call_to_action: str
-
-
 class OpenAIService:
     """OpenAI API service for intelligent content processing."""
     
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
-        self.research_model = "gpt-4"  # For complex analysis and synthesis
-        self.email_model = "gpt-3.5-turbo"  # For email generation
-        self.max_retries = 3
-        self.retry_delay = 1.0
+        self.client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=httpx.AsyncClient(
+                transport=AiohttpTransport(settings.openai_max_concurrency * 2)
+            ),
+            # Retries are handled by ChatCompletionClient
+            max_retries=0
+        )
+        # Structured outputs (json_schema) need the GPT-4o family
+        self.research_model = "gpt-4o"  # For complex analysis and synthesis
+        self.signal_model = "gpt-4o-mini"  # Per-signal classification hot path
+        self.email_model = "gpt-4o-mini"  # For email generation
+        self.chat = ChatCompletionClient(
+            self.client,
+            max_concurrency=settings.openai_max_concurrency,
+            semantic_cache_threshold=settings.openai_semantic_cache_threshold
+        )
     
     async def synthesize_research(
         self,
-        raw_data: List[Dict[str, any]],
-        consultant_profile: Dict[str, any],
+        raw_data: List[Dict[str, Any]],
+        consultant_profile: Dict[str, Any],
         target_company: str,
-        research_objectives: List[str]
+        research_objectives: List[str],
+        model: Optional[str] = None
     ) -> ResearchSummary:
         """
         Synthesize raw research data into actionable insights.
@@ -79,64 +77,45 @@ class OpenAIService:
             consultant_profile: Consultant's focus areas and preferences
             target_company: Company being researched
             research_objectives: Specific research goals
+            model: Override for the default research model
             
         Returns:
             ResearchSummary: Structured analysis and recommendations
         """
         
-        start_time = time.time()
+        model = model or self.research_model
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         
         try:
-            # Build comprehensive prompt for research synthesis
-            system_prompt = self._build_research_system_prompt(consultant_profile)
-            user_prompt = self._build_research_user_prompt(
-                raw_data, target_company, research_objectives
-            )
-            
-            logger.info(
-                "Starting research synthesis",
-                target_company=target_company,
-                data_points=len(raw_data),
-                objectives_count=len(research_objectives)
-            )
-            
             # Make OpenAI API call with retry logic
-            response = await self._make_api_call_with_retry(
-                model=self.research_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
+            response = await self.chat.complete(
+                model=model,
+                messages=build_research_messages(
+                    consultant_profile, raw_data, target_company, research_objectives
+                ),
                 temperature=0.3,  # Lower temperature for more focused analysis
                 max_tokens=2000,
-                timeout=60
+                timeout=60,
+                response_format=RESEARCH_RESPONSE_FORMAT,
+                semantic_cache_scope=target_company
             )
             
             # Parse and structure the response
-            synthesis_result = self._parse_research_response(
+            synthesis_result = parse_research_response(
                 response.choices[0].message.content,
                 len(raw_data)
             )
             
             # Record metrics
-            execution_time = time.time() - start_time
-            tokens_used = response.usage.total_tokens if response.usage else 0
-            cost = self._calculate_cost(self.research_model, tokens_used)
-            
-            record_openai_metrics(tokens_used, cost)
-            performance_logger.log_external_api_call(
-                service="openai",
-                endpoint="chat/completions",
-                response_time=execution_time,
-                status_code=200,
-                tokens_used=tokens_used,
-                cost=cost,
-                model=self.research_model
-            )
+            execution_time = loop.time() - start_time
+            tokens_used = record_call_metrics(model, execution_time, response.usage)
             
             logger.info(
                 "Research synthesis completed",
                 target_company=target_company,
+                data_points=len(raw_data),
+                objectives_count=len(research_objectives),
                 execution_time=execution_time,
                 tokens_used=tokens_used,
                 confidence_score=synthesis_result.confidence_score
@@ -145,7 +124,7 @@ class OpenAIService:
             return synthesis_result
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = loop.time() - start_time
             logger.error(
                 "Research synthesis failed",
                 target_company=target_company,
@@ -154,11 +133,71 @@ class OpenAIService:
             )
             raise_external_service_error("OpenAI", f"Research synthesis failed: {str(e)}")
     
+    async def synthesize_research_batch(
+        self,
+        jobs: List[ResearchBatchJob],
+        poll_interval: float = 60.0
+    ) -> Dict[str, ResearchSummary]:
+        """
+        Synthesize research for many companies through the OpenAI Batch API.
+        
+        Batch jobs cost half as much and draw on a separate rate-limit pool,
+        but complete within a 24h window; call this from background workers
+        for nightly or bulk research, not from request handlers.
+        
+        Args:
+            jobs: Research requests, each with a unique ``custom_id``
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            ResearchSummary per ``custom_id``; jobs that failed inside the
+            batch are logged and omitted.
+        """
+        
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        
+        try:
+            batch_id, results, usage = await run_research_batch(
+                self.client, self.research_model, jobs, poll_interval
+            )
+            
+            # Record metrics
+            execution_time = loop.time() - start_time
+            record_call_metrics(
+                self.research_model,
+                execution_time,
+                usage,
+                endpoint="batches",
+                cost_multiplier=BATCH_COST_MULTIPLIER
+            )
+            
+            logger.info(
+                "Research batch completed",
+                batch_id=batch_id,
+                jobs=len(jobs),
+                succeeded=len(results),
+                execution_time=execution_time
+            )
+            
+            return results
+            
+        except Exception as e:
+            execution_time = loop.time() - start_time
+            logger.error(
+                "Research batch failed",
+                jobs=len(jobs),
+                execution_time=execution_time,
+                error=str(e)
+            )
+            raise_external_service_error("OpenAI", f"Research batch failed: {str(e)}")
+    
     async def analyze_signal(
         self,
-        signal_data: Dict[str, any],
+        signal_data: Dict[str, Any],
         consultant_priorities: List[str],
-        company_context: Dict[str, any]
+        company_context: Dict[str, Any],
+        model: Optional[str] = None
     ) -> SignalAnalysis:
         """
         Analyze individual business signals for relevance and priority.
@@ -167,57 +206,50 @@ class OpenAIService:
             signal_data: Raw signal information
             consultant_priorities: Consultant's priority areas
             company_context: Company background information
+            model: Override for the default signal model, e.g. to escalate
+                a high-value signal to the research model
             
         Returns:
             SignalAnalysis: Structured signal assessment
         """
         
-        start_time = time.time()
+        model = model or self.signal_model
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         
         try:
-            system_prompt = self._build_signal_analysis_system_prompt(consultant_priorities)
-            user_prompt = self._build_signal_analysis_user_prompt(signal_data, company_context)
-            
-            logger.info(
-                "Starting signal analysis",
-                signal_type=signal_data.get("type", "unknown"),
-                company=company_context.get("name", "unknown")
-            )
-            
-            response = await self._make_api_call_with_retry(
-                model=self.research_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
+            response = await self.chat.complete(
+                model=model,
+                messages=build_signal_analysis_messages(
+                    consultant_priorities, signal_data, company_context
+                ),
                 temperature=0.2,
                 max_tokens=800,
-                timeout=30
+                timeout=30,
+                response_format=SIGNAL_RESPONSE_FORMAT,
+                semantic_cache_scope=company_context.get("name")
             )
             
-            analysis_result = self._parse_signal_analysis_response(
+            analysis_result = SignalAnalysis.model_validate_json(
                 response.choices[0].message.content
             )
             
             # Record metrics
-            execution_time = time.time() - start_time
-            tokens_used = response.usage.total_tokens if response.usage else 0
-            cost = self._calculate_cost(self.research_model, tokens_used)
+            execution_time = loop.time() - start_time
+            tokens_used = record_call_metrics(model, execution_time, response.usage)
             
-            record_openai_metrics(tokens_used, cost)
-            performance_logger.log_external_api_call(
-                service="openai",
-                endpoint="chat/completions",
-                response_time=execution_time,
-                tokens_used=tokens_used,
-                cost=cost,
-                model=self.research_model
+            logger.info(
+                "Signal analysis completed",
+                signal_type=signal_data.get("type", "unknown"),
+                company=company_context.get("name", "unknown"),
+                execution_time=execution_time,
+                tokens_used=tokens_used
             )
             
             return analysis_result
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = loop.time() - start_time
             logger.error(
                 "Signal analysis failed",
                 signal_data=signal_data,
@@ -228,10 +260,11 @@ class OpenAIService:
     
     async def generate_email_content(
         self,
-        prospect_data: Dict[str, any],
-        consultant_profile: Dict[str, any],
+        prospect_data: Dict[str, Any],
+        consultant_profile: Dict[str, Any],
         email_objective: str,
-        template_style: str = "professional"
+        template_style: str = "professional",
+        model: Optional[str] = None
     ) -> EmailContent:
         """
         Generate personalized email content for prospects.
@@ -241,63 +274,50 @@ class OpenAIService:
             consultant_profile: Consultant's background and positioning
             email_objective: Purpose of the email (intro, follow-up, etc.)
             template_style: Communication tone and style
+            model: Override for the default email model
             
         Returns:
             EmailContent: Generated email with personalization
         """
         
-        start_time = time.time()
+        model = model or self.email_model
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         
         try:
-            system_prompt = self._build_email_generation_system_prompt(
-                consultant_profile, template_style
-            )
-            user_prompt = self._build_email_generation_user_prompt(
-                prospect_data, email_objective
-            )
-            
-            logger.info(
-                "Starting email generation",
-                objective=email_objective,
-                prospect=prospect_data.get("name", "unknown"),
-                style=template_style
-            )
-            
-            response = await self._make_api_call_with_retry(
-                model=self.email_model,  # Use GPT-3.5 for email generation
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
+            response = await self.chat.complete(
+                model=model,
+                messages=build_email_generation_messages(
+                    consultant_profile, template_style, prospect_data, email_objective
+                ),
                 temperature=0.7,  # Higher temperature for more creative content
                 max_tokens=1000,
-                timeout=30
+                timeout=30,
+                response_format=EMAIL_RESPONSE_FORMAT
             )
             
-            email_content = self._parse_email_response(
+            email_content = parse_email_content(
                 response.choices[0].message.content,
                 template_style
             )
             
             # Record metrics
-            execution_time = time.time() - start_time
-            tokens_used = response.usage.total_tokens if response.usage else 0
-            cost = self._calculate_cost(self.email_model, tokens_used)
+            execution_time = loop.time() - start_time
+            tokens_used = record_call_metrics(model, execution_time, response.usage)
             
-            record_openai_metrics(tokens_used, cost)
-            performance_logger.log_external_api_call(
-                service="openai",
-                endpoint="chat/completions",
-                response_time=execution_time,
-                tokens_used=tokens_used,
-                cost=cost,
-                model=self.email_model
+            logger.info(
+                "Email generation completed",
+                objective=email_objective,
+                prospect=prospect_data.get("name", "unknown"),
+                style=template_style,
+                execution_time=execution_time,
+                tokens_used=tokens_used
             )
             
             return email_content
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = loop.time() - start_time
             logger.error(
                 "Email generation failed",
                 prospect_data=prospect_data,
@@ -306,266 +326,163 @@ class OpenAIService:
             )
             raise_external_service_error("OpenAI", f"Email generation failed: {str(e)}")
     
-    async def _make_api_call_with_retry(
-        self,
-        model: str,
-        messages: List[Dict[str, str]],
-        temperature: float = 0.5,
-        max_tokens: int = 1000,
-        timeout: int = 30
-    ) -> any:
-        """Make OpenAI API call with exponential backoff retry logic."""
-        
-        for attempt in range(self.max_retries):
-            try:
-                response = await self.client.chat.completions.create(
-                    model=model,
-                    messages=messages,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    timeout=timeout
-                )
-                
-                return response
-                
-            except openai.RateLimitError as e:
-                if attempt < self.max_retries - 1:
-                    wait_time = self.retry_delay * (2 ** attempt)
-                    logger.warning(
-                        f"OpenAI rate limit hit, retrying in {wait_time}s",
-                        attempt=attempt + 1,
-                        max_retries=self.max_retries
-                    )
-                    await asyncio.sleep(wait_time)
-                    continue
-                raise
-                
-            except openai.APIError as e:
-                if attempt < self.max_retries - 1 and e.status_code >= 500:
-                    wait_time = self.retry_delay * (2 ** attempt)
-                    logger.warning(
-                        f"OpenAI server error, retrying in {wait_time}s",
-                        attempt=attempt + 1,
-                        error=str(e)
-                    )
-                    await asyncio.sleep(wait_time)
-                    continue
-                raise
-                
-            except Exception as e:
-                logger.error(f"OpenAI API call failed: {e}")
-                raise
-    
-    def _build_research_system_prompt(self, consultant_profile: Dict[str, any]) -> str:
-        """Build system prompt for research synthesis."""
-        
-        return f"""You are an expert business intelligence analyst helping {consultant_profile.get('consultant_type', 'consultant')}s 
-with {consultant_profile.get('industry_focus', 'business')} expertise. Your role is to synthesize raw research data into 
-actionable insights for business development and client engagement.
-
-Focus areas: {', '.join(consultant_profile.get('signal_priorities', []))}
-Target company size: {consultant_profile.get('target_company_size', 'all sizes')}
-Geographic preference: {consultant_profile.get('geographic_preference', 'global')}
-
-Analyze the provided data and create a comprehensive research summary that:
-1. Identifies the most relevant business signals and opportunities
-2. Prioritizes findings based on the consultant's focus areas
-3. Provides specific, actionable recommendations
-4. Assesses confidence levels based on data quality and completeness
-
-Be concise, data-driven, and focus on insights that directly support business development activities."""
-    
-    def _build_research_user_prompt(
+    async def generate_email_content_stream(
         self,
-        raw_data: List[Dict[str, any]],
-        target_company: str,
-        research_objectives: List[str]
-    ) -> str:
-        """Build user prompt for research synthesis."""
+        prospect_data: Dict[str, Any],
+        consultant_profile: Dict[str, Any],
+        email_objective: str,
+        template_style: str = "professional",
+        model: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream email generation output as it is produced.
         
-        data_summary = []
-        for item in raw_data[:10]:  # Limit to prevent token overflow
-            data_summary.append(f"- {item.get('type', 'Unknown')}: {item.get('content', '')[:200]}...")
+        For WebSocket/UI consumers that can start work on the first chunks.
+        Chunks are fragments of the structured JSON response; once the
+        stream ends, the joined text parses with ``parse_email_content``.
+        Unlike ``generate_email_content`` there are no retries once
+        streaming has started.
         
-        return f"""Please analyze the following research data for {target_company}:
-
-RESEARCH OBJECTIVES:
-{chr(10).join(f'- {obj}' for obj in research_objectives)}
-
-RAW DATA SOURCES ({len(raw_data)} total):
-{chr(10).join(data_summary)}
-
-Please provide a structured analysis in the following format:
-1. EXECUTIVE SUMMARY (2-3 sentences)
-2. KEY FINDINGS (3-5 bullet points)
-3. BUSINESS SIGNALS (prioritized list with impact assessment)
-4. RECOMMENDED ACTIONS (specific next steps)
-5. CONFIDENCE SCORE (0.0-1.0 based on data quality)
-
-Focus on insights that directly support business development and client engagement opportunities."""
-    
-    def _build_signal_analysis_system_prompt(self, consultant_priorities: List[str]) -> str:
-        """Build system prompt for signal analysis."""
+        Args:
+            prospect_data: Target prospect information
+            consultant_profile: Consultant's background and positioning
+            email_objective: Purpose of the email (intro, follow-up, etc.)
+            template_style: Communication tone and style
+            model: Override for the default email model
+            
+        Yields:
+            Response text deltas in arrival order.
+        """
         
-        return f"""You are a business signal analysis expert. Your role is to evaluate individual business 
-signals for their relevance, priority, and potential impact based on consultant priorities.
-
-Priority areas: {', '.join(consultant_priorities)}
-
-For each signal, assess:
-1. Business impact and relevance
-2. Timing and urgency
-3. Actionability and next steps
-4. Priority score (0.0-1.0)
-5. Connection to other signals
-
-Be objective, data-driven, and focus on practical business implications."""
-    
-    def _build_signal_analysis_user_prompt(
-        self,
-        signal_data: Dict[str, any],
-        company_context: Dict[str, any]
-    ) -> str:
-        """Build user prompt for signal analysis."""
+        model = model or self.email_model
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        chunks = []
         
-        return f"""Analyze this business signal:
-
-SIGNAL DATA:
-Type: {signal_data.get('type', 'Unknown')}
-Content: {signal_data.get('content', '')}
-Source: {signal_data.get('source', 'Unknown')}
-Date: {signal_data.get('date', 'Unknown')}
-
-COMPANY CONTEXT:
-Name: {company_context.get('name', 'Unknown')}
-Industry: {company_context.get('industry', 'Unknown')}
-Size: {company_context.get('size', 'Unknown')}
-Background: {company_context.get('description', 'Unknown')}
-
-Please provide structured analysis:
-1. SIGNAL TYPE classification
-2. PRIORITY SCORE (0.0-1.0)
-3. BUSINESS IMPACT assessment
-4. TIMING RELEVANCE
-5. ACTION RECOMMENDATIONS
-6. RELATED SIGNALS potential"""
+        try:
+            messages = build_email_generation_messages(
+                consultant_profile, template_style, prospect_data, email_objective
+            )
+            
+            stream = await self.chat.open_stream(
+                model=model,
+                messages=messages,
+                temperature=0.7,
+                max_tokens=1000,
+                timeout=30,
+                response_format=EMAIL_RESPONSE_FORMAT
+            )
+            try:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        chunks.append(delta)
+                        yield delta
+            finally:
+                # Release the connection even if the consumer stops early
+                await stream.response.aclose()
+            
+            # Streamed responses carry no usage; count tokens locally
+            prompt_tokens = count_prompt_tokens(model, messages)
+            completion_tokens = len(encoder_for(model).encode("".join(chunks)))
+            execution_time = loop.time() - start_time
+            tokens_used = record_call_metrics(
+                model,
+                execution_time,
+                CompletionUsage(
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    total_tokens=prompt_tokens + completion_tokens
+                )
+            )
+            
+            logger.info(
+                "Email generation stream completed",
+                objective=email_objective,
+                prospect=prospect_data.get("name", "unknown"),
+                style=template_style,
+                execution_time=execution_time,
+                tokens_used=tokens_used
+            )
+            
+        except Exception as e:
+            execution_time = loop.time() - start_time
+            logger.error(
+                "Email generation stream failed",
+                prospect_data=prospect_data,
+                execution_time=execution_time,
+                chunks_received=len(chunks),
+                error=str(e)
+            )
+            raise_external_service_error("OpenAI", f"Email generation failed: {str(e)}")
     
-    def _build_email_generation_system_prompt(
+    async def analyze_signals_batch(
         self,
-        consultant_profile: Dict[str, any],
-        template_style: str
-    ) -> str:
-        """Build system prompt for email generation."""
+        signals: List[Dict[str, Any]],
+        consultant_priorities: List[str],
+        company_context: Dict[str, Any]
+    ) -> List[Union[SignalAnalysis, Exception]]:
+        """
+        Analyze many signals concurrently.
         
-        return f"""You are an expert email copywriter specializing in {template_style} business communications 
-for {consultant_profile.get('consultant_type', 'consultant')}s.
-
-Consultant background:
-- Industry focus: {consultant_profile.get('industry_focus', 'business')}
-- Solution positioning: {consultant_profile.get('solution_positioning', 'value creation')}
-- Communication style: {template_style}
-
-Create compelling, personalized emails that:
-1. Capture attention with relevant insights
-2. Demonstrate expertise and value
-3. Include clear call-to-action
-4. Maintain professional tone
-5. Are concise and actionable
-
-Avoid generic templates and focus on personalization based on prospect research."""
-    
-    def _build_email_generation_user_prompt(
-        self,
-        prospect_data: Dict[str, any],
-        email_objective: str
-    ) -> str:
-        """Build user prompt for email generation."""
+        Calls run in parallel up to ``settings.openai_max_concurrency``.
         
-        return f"""Generate a personalized email for this prospect:
-
-PROSPECT INFORMATION:
-Name: {prospect_data.get('name', 'Unknown')}
-Title: {prospect_data.get('title', 'Unknown')}
-Company: {prospect_data.get('company', 'Unknown')}
-Industry: {prospect_data.get('industry', 'Unknown')}
-Recent activity: {prospect_data.get('recent_signals', 'None available')}
-
-EMAIL OBJECTIVE: {email_objective}
-
-Please provide:
-1. SUBJECT LINE (compelling and specific)
-2. EMAIL BODY (personalized and value-focused)
-3. CALL TO ACTION (clear and specific)
-4. PERSONALIZATION POINTS (key elements used)
-
-Keep the email concise (under 150 words) and professional."""
-    
-    def _parse_research_response(self, response: str, sources_count: int) -> ResearchSummary:
-        """Parse OpenAI research synthesis response into structured format."""
+        Args:
+            signals: Raw signal records to analyze
+            consultant_priorities: Consultant's priority areas
+            company_context: Company background information
+            
+        Returns:
+            One SignalAnalysis per signal, in input order; failed analyses
+            are returned as their exception instead of aborting the batch.
+        """
         
-        # TODO: Implement robust parsing logic
-        # For now, return a structured placeholder
-        return ResearchSummary(
-            executive_summary=response[:200] + "..." if len(response) > 200 else response,
-            key_findings=["Finding 1", "Finding 2", "Finding 3"],
-            business_signals=[
-                {"type": "growth", "impact": "high", "confidence": 0.8},
-                {"type": "hiring", "impact": "medium", "confidence": 0.7}
-            ],
-            recommended_actions=["Action 1", "Action 2"],
-            confidence_score=0.75,
-            sources_analyzed=sources_count
+        return await asyncio.gather(
+            *(
+                self.analyze_signal(signal, consultant_priorities, company_context)
+                for signal in signals
+            ),
+            return_exceptions=True
         )
     
-    def _parse_signal_analysis_response(self, response: str) -> SignalAnalysis:
-        """Parse OpenAI signal analysis response into structured format."""
+    async def generate_emails_batch(
+        self,
+        prospects: List[Dict[str, Any]],
+        consultant_profile: Dict[str, Any],
+        email_objective: str,
+        template_style: str = "professional"
+    ) -> List[Union[EmailContent, Exception]]:
+        """
+        Generate emails for many prospects concurrently.
         
-        # TODO: Implement robust parsing logic
-        return SignalAnalysis(
-            signal_type="growth_indicator",
-            priority_score=0.8,
-            business_impact="High potential for engagement",
-            timing_relevance="Immediate opportunity",
-            action_recommendations=["Contact within 48 hours", "Prepare growth strategy proposal"],
-            related_signals=["hiring_expansion", "funding_announcement"]
-        )
-    
-    def _parse_email_response(self, response: str, tone: str) -> EmailContent:
-        """Parse OpenAI email generation response into structured format."""
+        Calls run in parallel up to ``settings.openai_max_concurrency``.
         
-        # TODO: Implement robust parsing logic
-        lines = response.split('\n')
+        Args:
+            prospects: Target prospect records
+            consultant_profile: Consultant's background and positioning
+            email_objective: Purpose of the emails
+            template_style: Communication tone and style
+            
+        Returns:
+            One EmailContent per prospect, in input order; failed generations
+            are returned as their exception instead of aborting the batch.
+        """
         
-        return EmailContent(
-            subject=lines[0] if lines else "Subject line generated",
-            body=response,
-            tone=tone,
-            personalization_points=["Company-specific insight", "Role-relevant challenge"],
-            call_to_action="Schedule a brief call to discuss opportunities"
+        return await asyncio.gather(
+            *(
+                self.generate_email_content(
+                    prospect, consultant_profile, email_objective, template_style
+                )
+                for prospect in prospects
+            ),
+            return_exceptions=True
         )
     
-    def _calculate_cost(self, model: str, tokens: int) -> float:
-        """Calculate API cost based on model and token usage."""
-        
-        # OpenAI pricing (as of implementation date)
-        pricing = {
-            "gpt-4": {"input": 0.03, "output": 0.06},  # per 1K tokens
-            "gpt-3.5-turbo": {"input": 0.0015, "output": 0.002}  # per 1K tokens
-        }
-        
-        if model not in pricing:
-            return 0.0
-        
-        # Estimate 75% input, 25% output tokens
-        input_tokens = tokens * 0.75
-        output_tokens = tokens * 0.25
-        
-        cost = (
-            (input_tokens / 1000) * pricing[model]["input"] +
-            (output_tokens / 1000) * pricing[model]["output"]
-        )
-        
-        return round(cost, 6)
+    async def close(self) -> None:
+        """Close the underlying HTTP client and its connection pool."""
+        await self.client.close()
 
 
 # Global service instance
@@ -0,0 +1,116 @@
+"""
+Token accounting for OpenAI calls in the Universal Consultant Intelligence Platform.
+
+Counts prompt tokens locally, clamps output budgets to each model's
+context window, and prices and records calls from their token usage.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import tiktoken
+from openai.types import CompletionUsage
+
+from backend.core.logging import performance_logger
+from backend.core.monitoring import record_openai_metrics
+
+# USD per token as (input, output), from OpenAI's per-1K-token pricing
+TOKEN_RATES = {
+    "gpt-4": (0.03 / 1000, 0.06 / 1000),
+    "gpt-4o": (0.0025 / 1000, 0.01 / 1000),
+    "gpt-4o-mini": (0.00015 / 1000, 0.0006 / 1000),
+    "gpt-3.5-turbo": (0.0015 / 1000, 0.002 / 1000),
+}
+
+# Context window per model; max_tokens is clamped so prompt + output fit
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-4": 8192,
+    "gpt-4o": 128000,
+    "gpt-4o-mini": 128000,
+    "gpt-3.5-turbo": 16385,
+}
+# Per-message framing tokens plus a safety margin for the reply priming
+MESSAGE_TOKEN_OVERHEAD = 4
+CONTEXT_SAFETY_MARGIN = 64
+
+
+@lru_cache(maxsize=None)
+def encoder_for(model: str) -> tiktoken.Encoding:
+    """Return the (cached) tokenizer for a model."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Models newer than the pinned tiktoken: cl100k is a close estimate
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_prompt_tokens(model: str, messages: List[Dict[str, str]]) -> int:
+    """Count the prompt tokens a chat request will be billed for."""
+    encoder = encoder_for(model)
+    return sum(
+        len(encoder.encode(message["content"])) + MESSAGE_TOKEN_OVERHEAD
+        for message in messages
+    )
+
+
+def output_token_budget(model: str, messages: List[Dict[str, str]], requested: int) -> int:
+    """
+    Clamp ``max_tokens`` so the measured prompt plus output fits the context.
+    
+    Raises:
+        ValueError: If the prompt alone leaves no room for a response.
+    """
+    context_window = MODEL_CONTEXT_WINDOWS.get(model)
+    if context_window is None:
+        return requested
+    
+    input_tokens = count_prompt_tokens(model, messages)
+    available = context_window - input_tokens - CONTEXT_SAFETY_MARGIN
+    if available <= 0:
+        raise ValueError(
+            f"Prompt of {input_tokens} tokens exceeds the {context_window}-token context of {model}"
+        )
+    return min(requested, available)
+
+
+def calculate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Calculate API cost from the actual prompt and completion token counts."""
+    input_rate, output_rate = TOKEN_RATES.get(model, (0.0, 0.0))
+    return input_rate * prompt_tokens + output_rate * completion_tokens
+
+
+def record_call_metrics(
+    model: str,
+    execution_time: float,
+    usage: Optional[CompletionUsage],
+    endpoint: str = "chat/completions",
+    cost_multiplier: float = 1.0
+) -> int:
+    """
+    Record usage metrics and the performance log entry for one OpenAI call.
+    
+    Args:
+        model: Model the call was billed against
+        execution_time: Wall-clock seconds the call took
+        usage: Token usage; None for cached responses, which cost nothing
+        endpoint: API endpoint, for the performance log
+        cost_multiplier: Discount on the synchronous token price
+    
+    Returns:
+        Total tokens used.
+    """
+    prompt_tokens = usage.prompt_tokens if usage else 0
+    completion_tokens = usage.completion_tokens if usage else 0
+    tokens_used = prompt_tokens + completion_tokens
+    cost = calculate_cost(model, prompt_tokens, completion_tokens) * cost_multiplier
+    record_openai_metrics(tokens_used, cost)
+    performance_logger.log_external_api_call(
+        service="openai",
+        endpoint=endpoint,
+        response_time=execution_time,
+        status_code=200,
+        tokens_used=tokens_used,
+        cost=cost,
+        model=model
+    )
+    return tokens_used
@@ -0,0 +1,104 @@
+"""
+aiohttp-backed httpx transport for the OpenAI client.
+
+Lets the OpenAI SDK keep its httpx-based API, retries and error types
+while requests go over a shared aiohttp connection pool.
+"""
+
+import asyncio
+from typing import AsyncIterator, Optional
+
+import aiohttp
+import httpx
+
+# Keep idle OpenAI connections (and their TLS sessions) warm between bursts,
+# and skip repeat DNS lookups for api.openai.com
+KEEPALIVE_TIMEOUT_SECONDS = 60
+DNS_CACHE_TTL_SECONDS = 300
+
+
+class _AiohttpResponseStream(httpx.AsyncByteStream):
+    """Response body read incrementally from an aiohttp response."""
+    
+    def __init__(self, response: aiohttp.ClientResponse, request: httpx.Request):
+        self._response = response
+        self._request = request
+    
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._response.content.iter_any():
+                yield chunk
+        except asyncio.TimeoutError as e:
+            raise httpx.ReadTimeout(str(e), request=self._request) from e
+        except aiohttp.ClientError as e:
+            raise httpx.ReadError(str(e), request=self._request) from e
+    
+    async def aclose(self) -> None:
+        # Reason: a fully read body has already returned its connection to
+        # the pool, so this only drops connections abandoned mid-body
+        self._response.close()
+
+
+class AiohttpTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that sends requests over a shared aiohttp session.
+    
+    httpx's own connection pool degrades badly past a few dozen concurrent
+    requests; aiohttp's connector holds up under the batch fan-out. The
+    OpenAI SDK keeps its httpx-based API, retries and error types.
+    """
+    
+    def __init__(self, connection_limit: int):
+        self._connection_limit = connection_limit
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Reason: created lazily so the session binds to the running loop,
+        # not the import-time one. One session serves every call made by the
+        # process-wide openai_service until close().
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._connection_limit,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+                    ttl_dns_cache=DNS_CACHE_TTL_SECONDS
+                ),
+                # httpx decodes the body itself from Content-Encoding
+                auto_decompress=False
+            )
+        return self._session
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        timeouts = request.extensions.get("timeout", {})
+        client_timeout = aiohttp.ClientTimeout(
+            total=None,
+            connect=timeouts.get("connect"),
+            sock_read=timeouts.get("read")
+        )
+        
+        try:
+            response = await self._get_session().request(
+                request.method,
+                str(request.url),
+                headers=request.headers.multi_items(),
+                data=await request.aread(),
+                timeout=client_timeout
+            )
+        except asyncio.TimeoutError as e:
+            raise httpx.ReadTimeout(str(e), request=request) from e
+        except aiohttp.ClientError as e:
+            raise httpx.ConnectError(str(e), request=request) from e
+        
+        # Reason: hand the body over as a stream so SSE responses reach the
+        # SDK chunk by chunk; httpx reads it in full for non-streaming calls
+        return httpx.Response(
+            status_code=response.status,
+            headers=list(response.raw_headers),
+            stream=_AiohttpResponseStream(response, request),
+            request=request
+        )
+    
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -2,19 +2,27 @@
 Web scraping service for the Universal Consultant Intelligence Platform.
 
 Provides intelligent web scraping for business signals, company information,
-news articles, and industry data using Beautiful Soup and aiohttp.
+news articles, and industry data using selectolax (or Beautiful Soup with
+lxml, selectable via ``scraping_html_parser``) and aiohttp.
 """
 
 import asyncio
+import codecs
+import heapq
 import re
 import time
-from typing import Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
+import ahocorasick
 import aiohttp
+import orjson
+import soupsieve
 import structlog
 from bs4 import BeautifulSoup
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
+from selectolax.lexbor import LexborHTMLParser
 
 from backend.core.config import settings
 from backend.core.logging import performance_logger
@@ -22,6 +30,117 @@ from backend.utils.exceptions import raise_external_service_error
 
 logger = structlog.get_logger(__name__)
 
+# Target types built from the company's own site, checked with HEAD before scraping
+COMPANY_PAGE_TYPES = frozenset({'company_page', 'news_section', 'press_section', 'careers_page'})
+# HEAD statuses that mean the page doesn't exist; anything else (bot blocks,
+# rate limits, server errors, HEAD not supported) leaves it to the scrape
+MISSING_PAGE_STATUSES = frozenset({404, 410})
+# A probe that can't answer quickly is no cheaper than the scrape it guards
+PROBE_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Hosts remembered for per-host pacing before expired entries are pruned; the
+# service is process-wide, so without pruning every domain ever scraped stays
+MAX_TRACKED_HOSTS = 256
+
+# Pages are read up to this size; extraction keeps only the first 20 blocks,
+# so the tail of bloated pages only costs parse time and memory
+MAX_HTML_BYTES = 512 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+
+# Leading bytes searched for a <meta> charset when the response header has none
+CHARSET_SNIFF_BYTES = 4096
+_META_CHARSET = re.compile(rb'<meta[^>]+?charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+
+# Only the first few ld+json blocks are parsed; later ones are rarely the page entity
+MAX_STRUCTURED_DATA_BLOCKS = 3
+
+
+@lru_cache(maxsize=256)
+def _compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once per process; targets share identical selectors."""
+    return soupsieve.compile(selector)
+
+
+@lru_cache(maxsize=128)
+def _keyword_automaton(keywords: Tuple[str, ...]) -> ahocorasick.Automaton:
+    """
+    Build an Aho-Corasick automaton matching any of the given keywords.
+    
+    Targets in one scrape share a keyword list, so the automaton is built
+    once per distinct (sorted, lowercased) keyword set.
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _parse_structured_data(blocks: List[str]) -> List[Any]:
+    """Parse the leading ld+json script bodies, skipping any that are invalid."""
+    parsed = []
+    for block in blocks[:MAX_STRUCTURED_DATA_BLOCKS]:
+        try:
+            parsed.append(orjson.loads(block))
+        except orjson.JSONDecodeError:
+            continue
+    return parsed
+
+
+def _known_encoding(name: Optional[str]) -> Optional[str]:
+    """Return the codec name for a declared charset, or None if Python doesn't know it."""
+    if not name:
+        return None
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def _decode_html(body: bytes, header_charset: Optional[str]) -> str:
+    """
+    Decode a page body that may have been cut off at ``MAX_HTML_BYTES``.
+    
+    Uses the Content-Type charset, else a ``<meta>`` charset declaration near
+    the top of the page, else UTF-8, falling back to windows-1252 (the HTML
+    default for undeclared legacy pages) when the body isn't valid UTF-8.
+    Unknown charset names are skipped rather than failing the page.
+    """
+    encoding = _known_encoding(header_charset)
+    if encoding is None:
+        declared = _META_CHARSET.search(body, 0, CHARSET_SNIFF_BYTES)
+        encoding = _known_encoding(declared.group(1).decode('ascii') if declared else None)
+    
+    if encoding is not None:
+        # A multi-byte character cut off by truncation is replaced
+        return body.decode(encoding, errors='replace')
+    
+    try:
+        # Reason: final=False drops a trailing character cut off by truncation
+        # instead of treating it as invalid UTF-8
+        return codecs.getincrementaldecoder('utf-8')().decode(body, final=False)
+    except UnicodeDecodeError:
+        return body.decode('windows-1252', errors='replace')
+
+
+def _automaton_for(keywords: List[str]) -> Optional[ahocorasick.Automaton]:
+    """Return the cached automaton for a keyword list, or None when it has no keywords."""
+    words = tuple(sorted({keyword.lower() for keyword in keywords if keyword}))
+    return _keyword_automaton(words) if words else None
+
+
+def _find_keywords(keywords: List[str], text: str) -> Dict[str, int]:
+    """Map each lowercased keyword present in the lowercased text to its first offset."""
+    automaton = _automaton_for(keywords)
+    if automaton is None:
+        return {}
+    
+    offsets: Dict[str, int] = {}
+    for end_index, keyword in automaton.iter(text):
+        # Matches arrive in end order, so a keyword's first hit is its first occurrence
+        offsets.setdefault(keyword, end_index - len(keyword) + 1)
+    return offsets
+
 
 class ScrapedContent(BaseModel):
     """Scraped content model."""
@@ -29,10 +148,20 @@ class ScrapedContent(BaseModel):
     url: str
     title: str
     content: str
-    metadata: Dict[str, any]
-    signals: List[Dict[str, any]]
+    metadata: Dict[str, Any]
+    signals: List[Dict[str, Any]]
     scraped_at: float
     processing_time: float
+    
+    # Lowercased ``content``, computed once at scrape time for keyword matching
+    _content_lower: Optional[str] = PrivateAttr(default=None)
+    
+    @property
+    def content_lower(self) -> str:
+        """Lowercased page content."""
+        if self._content_lower is None:
+            self._content_lower = self.content.lower()
+        return self._content_lower
 
 
 class ScrapingTarget(BaseModel):
@@ -44,6 +173,19 @@ class ScrapingTarget(BaseModel):
     signal_keywords: List[str]
     max_depth: int = 1
     follow_links: bool = False
+    
+    def compiled_selector(self, name: str, default: str) -> soupsieve.SoupSieve:
+        """
+        Return the compiled CSS selector for a selectors key.
+        
+        Compiled selectors are cached process-wide by selector string, so
+        targets (and scrapes) sharing a selector compile it once.
+        
+        Args:
+            name: Key in ``selectors`` (e.g. 'title', 'content')
+            default: Selector used when the key is not configured
+        """
+        return _compile_selector(self.selectors.get(name, default))
 
 
 class WebScrapingService:
@@ -55,14 +197,16 @@ class WebScrapingService:
             'User-Agent': 'Universal Consultant Intelligence Platform/1.0 (+https://consultant-platform.com/bot)',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': 'gzip, deflate, br',  # br decoded by aiohttp via Brotli
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
         self.timeout = aiohttp.ClientTimeout(total=30, connect=10)
         self.max_concurrent = 10
-        self.delay_between_requests = 1.0
+        self.delay_between_requests = 1.0  # Minimum spacing between requests to one host
+        # Host -> earliest time its next request may start (event-loop clock)
+        self._host_next_request: Dict[str, float] = {}
         
         # Signal detection patterns
         self.signal_patterns = {
@@ -109,29 +253,57 @@ class WebScrapingService:
                 r'joins as'
             ]
         }
+        
+        # One compiled alternation per signal type, so each page is scanned once
+        # per type; group gN maps a match back to signal_patterns[type][N].
+        # Reason: patterns are lowercase and run against lowercased content,
+        # so case-insensitive matching would only slow the scan down.
+        self._union_signal_patterns = {
+            signal_type: re.compile(
+                '|'.join(f'(?P<g{i}>{pattern})' for i, pattern in enumerate(patterns))
+            )
+            for signal_type, patterns in self.signal_patterns.items()
+        }
     
-    async def __aenter__(self):
-        """Async context manager entry."""
+    async def startup(self) -> None:
+        """
+        Open the shared HTTP session.
+        
+        Called once at application startup; the session (and its pooled
+        keep-alive connections and DNS cache) then lives until ``close()``.
+        The scrape methods call it too, so it is a no-op when already open.
+        """
         if not self.session:
             connector = aiohttp.TCPConnector(
                 limit=self.max_concurrent,
                 limit_per_host=5,
-                keepalive_timeout=30,
-                enable_cleanup_closed=True
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+                use_dns_cache=True,
+                ttl_dns_cache=300
             )
             self.session = aiohttp.ClientSession(
                 connector=connector,
                 headers=self.headers,
-                timeout=self.timeout
+                timeout=self.timeout,
+                auto_decompress=True
             )
-        return self
     
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
         if self.session:
             await self.session.close()
             self.session = None
     
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.startup()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+    
     async def scrape_company_intelligence(
         self,
         company_name: str,
@@ -160,28 +332,16 @@ class WebScrapingService:
                 target_signals=target_signals
             )
             
-            # Build scraping targets
+            await self.startup()
+            
+            # Build scraping targets, skipping company pages that don't exist
             targets = await self._build_company_targets(
                 company_name, company_domain, target_signals or []
             )
+            targets = await self._drop_missing_pages(targets)
             
-            # Scrape all targets concurrently
-            scraped_content = []
-            
-            async with self:
-                semaphore = asyncio.Semaphore(self.max_concurrent)
-                tasks = [
-                    self._scrape_single_target(target, semaphore)
-                    for target in targets
-                ]
-                
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                for result in results:
-                    if isinstance(result, ScrapedContent):
-                        scraped_content.append(result)
-                    elif isinstance(result, Exception):
-                        logger.warning(f"Scraping task failed: {result}")
+            # Scrape all targets concurrently over the shared session
+            scraped_content = await self._scrape_targets(targets)
             
             # Filter and prioritize content
             prioritized_content = self._prioritize_scraped_content(
@@ -249,21 +409,9 @@ class WebScrapingService:
             # Build news source targets
             targets = await self._build_news_targets(industry_keywords, time_range)
             
-            # Scrape news sources
-            scraped_articles = []
-            
-            async with self:
-                semaphore = asyncio.Semaphore(self.max_concurrent)
-                tasks = [
-                    self._scrape_single_target(target, semaphore)
-                    for target in targets
-                ]
-                
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                for result in results:
-                    if isinstance(result, ScrapedContent):
-                        scraped_articles.append(result)
+            # Scrape news sources over the shared session
+            await self.startup()
+            scraped_articles = await self._scrape_targets(targets)
             
             # Filter for relevance and signals
             relevant_articles = self._filter_relevant_content(
@@ -293,6 +441,23 @@ class WebScrapingService:
             )
             raise_external_service_error("Web Scraping", f"News scraping failed: {str(e)}")
     
+    async def _scrape_targets(self, targets: List[ScrapingTarget]) -> List[ScrapedContent]:
+        """
+        Scrape targets concurrently, returning the pages that succeeded in target order.
+        
+        ``_scrape_single_target`` logs and swallows its own failures, so a
+        failed target yields None rather than cancelling the group.
+        """
+        
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(self._scrape_single_target(target, semaphore))
+                for target in targets
+            ]
+        
+        return [task.result() for task in tasks if task.result() is not None]
+    
     async def _scrape_single_target(
         self,
         target: ScrapingTarget,
@@ -300,46 +465,67 @@ class WebScrapingService:
     ) -> Optional[ScrapedContent]:
         """Scrape a single target URL with rate limiting."""
         
+        # Pace per host before taking a slot, so waiting on one slow-paced
+        # domain doesn't hold up targets on other domains
+        await self._wait_for_host_slot(urlparse(target.url).netloc)
+        
         async with semaphore:
             start_time = time.time()
             
             try:
-                # Respect rate limiting
-                await asyncio.sleep(self.delay_between_requests)
-                
-                logger.debug(f"Scraping target: {target.url}")
+                # Reason: structured fields, so a filtered-out debug call formats nothing
+                logger.debug("Scraping target", url=target.url)
                 
                 async with self.session.get(target.url) as response:
                     if response.status != 200:
                         logger.warning(
-                            f"Non-200 response from {target.url}",
+                            "Non-200 response",
+                            url=target.url,
                             status=response.status
                         )
                         return None
                     
-                    html_content = await response.text()
                     content_type = response.headers.get('content-type', '').lower()
                     
                     if 'html' not in content_type:
-                        logger.warning(f"Non-HTML content from {target.url}")
+                        logger.warning("Non-HTML content", url=target.url)
                         return None
+                    
+                    # Stream the body and stop at MAX_HTML_BYTES
+                    html_bytes = bytearray()
+                    truncated = False
+                    async for chunk in response.content.iter_chunked(READ_CHUNK_BYTES):
+                        html_bytes += chunk
+                        if len(html_bytes) >= MAX_HTML_BYTES:
+                            truncated = True
+                            del html_bytes[MAX_HTML_BYTES:]
+                            break
+                    
+                    # Reason: the body was never read whole, so decode it here
+                    # rather than through response.text()
+                    html_content = _decode_html(html_bytes, response.charset)
                 
-                # Parse content
-                soup = BeautifulSoup(html_content, 'html.parser')
+                # Parse and extract structured content
+                if settings.scraping_html_parser == "selectolax":
+                    title, content, metadata = self._extract_page_selectolax(html_content, target)
+                else:
+                    soup = BeautifulSoup(html_content, 'lxml')
+                    title = self._extract_title(soup, target)
+                    content = self._extract_content(soup, target)
+                    metadata = self._extract_metadata(soup, target)
                 
-                # Extract structured content
-                title = self._extract_title(soup, target)
-                content = self._extract_content(soup, target)
-                metadata = self._extract_metadata(soup, target)
+                if truncated:
+                    metadata['truncated'] = True
                 
                 # Detect business signals
+                content_lower = content.lower()
                 signals = self._detect_signals(
-                    content, target.signal_keywords, target.target_type
+                    content, content_lower, target.signal_keywords, target.target_type
                 )
                 
                 processing_time = time.time() - start_time
                 
-                return ScrapedContent(
+                scraped = ScrapedContent(
                     url=target.url,
                     title=title,
                     content=content,
@@ -348,16 +534,43 @@ class WebScrapingService:
                     scraped_at=time.time(),
                     processing_time=processing_time
                 )
+                scraped._content_lower = content_lower
+                return scraped
                 
             except Exception as e:
                 processing_time = time.time() - start_time
                 logger.error(
-                    f"Failed to scrape {target.url}",
+                    "Failed to scrape target",
+                    url=target.url,
                     error=str(e),
                     processing_time=processing_time
                 )
                 return None
     
+    async def _wait_for_host_slot(self, host: str) -> None:
+        """Wait until ``delay_between_requests`` has passed since the host's last request."""
+        
+        now = asyncio.get_running_loop().time()
+        if len(self._host_next_request) > MAX_TRACKED_HOSTS:
+            self._prune_host_slots(now)
+        
+        # Reason: reserving the slot before sleeping, with no await in
+        # between, queues concurrent callers for one host without a lock
+        slot = max(now, self._host_next_request.get(host, 0.0))
+        self._host_next_request[host] = slot + self.delay_between_requests
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    def _prune_host_slots(self, now: float) -> None:
+        """Forget hosts whose pacing window has already passed."""
+        
+        # A passed window imposes no wait, so dropping it changes nothing
+        self._host_next_request = {
+            host: next_request
+            for host, next_request in self._host_next_request.items()
+            if next_request > now
+        }
+    
     async def _build_company_targets(
         self,
         company_name: str,
@@ -404,6 +617,41 @@ class WebScrapingService:
         
         return targets
     
+    async def _drop_missing_pages(self, targets: List[ScrapingTarget]) -> List[ScrapingTarget]:
+        """
+        HEAD-probe company pages and drop those that answer 404 or 410.
+        
+        Most companies lack some of the standard paths, so this saves a full
+        download, parse and pacing slot per missing page. Every other answer,
+        or a probe that failed without an HTTP status, keeps the page; other
+        targets are never probed.
+        """
+        
+        async def probe(url: str) -> Optional[int]:
+            # Reason: the probes run concurrently ahead of the paced scrapes;
+            # taking pacing slots would delay every existing page's GET by
+            # one more delay per probe on the same host
+            try:
+                async with self.session.head(
+                    url, allow_redirects=True, timeout=PROBE_TIMEOUT
+                ) as response:
+                    return response.status
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                # Reason: a network blip says nothing about whether the page
+                # exists; leave it to the scrape, which logs its own failure
+                return None
+        
+        pages = [target for target in targets if target.target_type in COMPANY_PAGE_TYPES]
+        statuses = await asyncio.gather(*(probe(target.url) for target in pages))
+        missing = {
+            target.url for target, status in zip(pages, statuses)
+            if status in MISSING_PAGE_STATUSES
+        }
+        if missing:
+            logger.debug("Skipping missing company pages", urls=sorted(missing))
+        
+        return [target for target in targets if target.url not in missing]
+    
     async def _build_news_targets(
         self,
         industry_keywords: List[str],
@@ -437,11 +685,65 @@ class WebScrapingService:
         
         return targets
     
+    def _extract_page_selectolax(
+        self,
+        html_content: str,
+        target: ScrapingTarget
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Extract title, content and metadata with the lexbor-backed selectolax parser.
+        
+        Mirrors ``_extract_title``, ``_extract_content`` and ``_extract_metadata``
+        without building a BeautifulSoup tree.
+        
+        Returns:
+            Tuple of (title, content, metadata)
+        """
+        
+        tree = LexborHTMLParser(html_content)
+        
+        # Title, falling back to the page title
+        title_element = tree.css_first(target.selectors.get('title', 'title'))
+        if title_element is None:
+            title_element = tree.css_first('title')
+        title = title_element.text(strip=True) if title_element is not None else "No title found"
+        
+        # Main content, falling back to all paragraphs
+        content_elements = tree.css(target.selectors.get('content', 'main, .content, article, p'))
+        if not content_elements:
+            content_elements = tree.css('p')
+        content_pieces = []
+        for element in content_elements[:20]:  # Limit to prevent excessive content
+            text = element.text(strip=True)
+            if len(text) > 50:  # Only include substantial text blocks
+                content_pieces.append(text)
+        
+        metadata = {
+            'target_type': target.target_type,
+            'domain': urlparse(target.url).netloc,
+            'scraped_elements': 0
+        }
+        
+        for meta in tree.css('meta'):
+            attributes = meta.attributes
+            name = attributes.get('name') or (attributes.get('property') or '').replace('og:', '')
+            content = attributes.get('content')
+            if name and content:
+                metadata[f'meta_{name}'] = content
+        
+        structured_data = tree.css('script[type="application/ld+json"]')
+        if structured_data:
+            metadata['structured_data_found'] = len(structured_data)
+            metadata['structured_data'] = _parse_structured_data(
+                [script.text(deep=True) for script in structured_data[:MAX_STRUCTURED_DATA_BLOCKS]]
+            )
+        
+        return title, '\n\n'.join(content_pieces), metadata
+    
     def _extract_title(self, soup: BeautifulSoup, target: ScrapingTarget) -> str:
         """Extract title from page."""
         
-        title_selector = target.selectors.get('title', 'title')
-        title_element = soup.select_one(title_selector)
+        title_element = target.compiled_selector('title', 'title').select_one(soup)
         
         if title_element:
             return title_element.get_text(strip=True)
@@ -453,23 +755,25 @@ class WebScrapingService:
     def _extract_content(self, soup: BeautifulSoup, target: ScrapingTarget) -> str:
         """Extract main content from page."""
         
-        content_selector = target.selectors.get('content', 'main, .content, article, p')
-        content_elements = soup.select(content_selector)
+        # Limit to prevent excessive content
+        content_elements = target.compiled_selector(
+            'content', 'main, .content, article, p'
+        ).select(soup, limit=20)
         
         if not content_elements:
             # Fallback to all paragraphs
-            content_elements = soup.find_all('p')
+            content_elements = soup.find_all('p', limit=20)
         
         # Clean and combine content
         content_pieces = []
-        for element in content_elements[:20]:  # Limit to prevent excessive content
+        for element in content_elements:
             text = element.get_text(strip=True)
             if len(text) > 50:  # Only include substantial text blocks
                 content_pieces.append(text)
         
         return '\n\n'.join(content_pieces)
     
-    def _extract_metadata(self, soup: BeautifulSoup, target: ScrapingTarget) -> Dict[str, any]:
+    def _extract_metadata(self, soup: BeautifulSoup, target: ScrapingTarget) -> Dict[str, Any]:
         """Extract metadata from page."""
         
         metadata = {
@@ -478,11 +782,11 @@ class WebScrapingService:
             'scraped_elements': 0
         }
         
-        # Extract meta tags
-        meta_tags = soup.find_all('meta')
-        for meta in meta_tags:
-            name = meta.get('name') or meta.get('property', '').replace('og:', '')
-            content = meta.get('content')
+        # Extract meta tags, reading each tag's attribute dict directly
+        for meta in soup.find_all('meta', attrs={'content': True}):
+            attributes = meta.attrs
+            name = attributes.get('name') or attributes.get('property', '').replace('og:', '')
+            content = attributes['content']
             if name and content:
                 metadata[f'meta_{name}'] = content
         
@@ -490,57 +794,65 @@ class WebScrapingService:
         structured_data = soup.find_all('script', type='application/ld+json')
         if structured_data:
             metadata['structured_data_found'] = len(structured_data)
+            metadata['structured_data'] = _parse_structured_data(
+                [script.get_text() for script in structured_data[:MAX_STRUCTURED_DATA_BLOCKS]]
+            )
         
         return metadata
     
     def _detect_signals(
         self,
         content: str,
+        content_lower: str,
         signal_keywords: List[str],
         target_type: str
-    ) -> List[Dict[str, any]]:
-        """Detect business signals in content."""
+    ) -> List[Dict[str, Any]]:
+        """Detect business signals in content (``content_lower`` is its lowercased form)."""
         
         signals = []
-        content_lower = content.lower()
         
         # Check each signal pattern
-        for signal_type, patterns in self.signal_patterns.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, content_lower, re.IGNORECASE)
-                for match in matches:
-                    signals.append({
-                        'type': signal_type,
-                        'pattern': pattern,
-                        'match': match,
-                        'confidence': self._calculate_signal_confidence(
-                            signal_type, match, target_type
-                        ),
-                        'context': self._extract_signal_context(content, match)
-                    })
-        
-        # Check for custom signal keywords
+        for signal_type, union in self._union_signal_patterns.items():
+            patterns = self.signal_patterns[signal_type]
+            for found in union.finditer(content_lower):
+                match = found.group(0)
+                signals.append({
+                    'type': signal_type,
+                    'pattern': patterns[int(found.lastgroup[1:])],
+                    'match': match,
+                    'confidence': self._calculate_signal_confidence(
+                        signal_type, match, target_type
+                    ),
+                    'context': self._extract_signal_context(
+                        content, content_lower, match, found.start()
+                    )
+                })
+        
+        # Check for custom signal keywords in a single pass over the content
+        keyword_offsets = _find_keywords(signal_keywords, content_lower)
         for keyword in signal_keywords:
-            if keyword.lower() in content_lower:
+            offset = keyword_offsets.get(keyword.lower())
+            if offset is not None:
                 signals.append({
                     'type': 'custom',
                     'pattern': keyword,
                     'match': keyword,
                     'confidence': 0.7,
-                    'context': self._extract_signal_context(content, keyword)
+                    'context': self._extract_signal_context(
+                        content, content_lower, keyword, offset
+                    )
                 })
         
-        # Deduplicate and sort by confidence
-        unique_signals = []
-        seen_matches = set()
-        
-        for signal in sorted(signals, key=lambda x: x['confidence'], reverse=True):
-            match_key = f"{signal['type']}:{signal['match']}"
-            if match_key not in seen_matches:
-                unique_signals.append(signal)
-                seen_matches.add(match_key)
+        # Deduplicate, keeping the most confident signal per (type, match)
+        best: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for signal in signals:
+            match_key = (signal['type'], signal['match'])
+            previous = best.get(match_key)
+            if previous is None or signal['confidence'] > previous['confidence']:
+                best[match_key] = signal
         
-        return unique_signals[:10]  # Return top 10 signals
+        # Return top 10 signals without sorting the rest
+        return heapq.nlargest(10, best.values(), key=lambda x: x['confidence'])
     
     def _calculate_signal_confidence(
         self,
@@ -562,22 +874,47 @@ class WebScrapingService:
         
         confidence = base_confidence + type_boost.get(target_type, 0.0)
         
-        # Boost confidence for specific patterns
-        if any(word in match.lower() for word in ['million', 'billion', 'series', 'round']):
+        # Boost confidence for specific patterns (matches come from lowercased content)
+        if any(word in match for word in ('million', 'billion', 'series', 'round')):
             confidence += 0.1
         
         return min(confidence, 1.0)
     
-    def _extract_signal_context(self, content: str, match: str) -> str:
-        """Extract context around a detected signal."""
+    def _extract_signal_context(
+        self,
+        content: str,
+        content_lower: str,
+        match: str,
+        offset: Optional[int] = None
+    ) -> str:
+        """
+        Extract the sentence around a detected signal.
         
-        # Find the sentence containing the match
-        sentences = content.split('.')
-        for sentence in sentences:
-            if match.lower() in sentence.lower():
-                return sentence.strip()[:200]  # Return first 200 chars
+        Args:
+            content: Page content
+            content_lower: Lowercased page content
+            match: Matched text
+            offset: Match position in ``content_lower``; located when omitted
+            
+        Returns:
+            str: Sentence containing the match (first 200 chars), or the match itself
+        """
         
-        return match
+        if offset is None:
+            offset = content_lower.find(match.lower())
+            if offset < 0:
+                return match
+        
+        # Reason: lower() can change the length of some non-ASCII text, which
+        # would shift offsets; fall back to slicing the lowercased copy then
+        text = content if len(content) == len(content_lower) else content_lower
+        
+        # Sentence bounds around the match; dots inside it (e.g. "$5.2m") don't split
+        start = text.rfind('.', 0, offset) + 1
+        end = text.find('.', offset + len(match))
+        if end < 0:
+            end = len(text)
+        return text[start:end].strip()[:200]  # Return first 200 chars
     
     def _prioritize_scraped_content(
         self,
@@ -586,16 +923,15 @@ class WebScrapingService:
     ) -> List[ScrapedContent]:
         """Prioritize scraped content based on signal relevance."""
         
+        target_signal_set = set(target_signals)
+        
         def calculate_priority_score(content: ScrapedContent) -> float:
             score = 0.0
             
-            # Base score from signal count and confidence
+            # Signal confidence plus a bonus for target signals, in one pass
             for signal in content.signals:
                 score += signal['confidence']
-            
-            # Bonus for target signals
-            for signal in content.signals:
-                if signal['pattern'] in target_signals:
+                if signal['pattern'] in target_signal_set:
                     score += 0.5
             
             # Bonus for fresh content (assumed based on processing time)
@@ -619,18 +955,18 @@ class WebScrapingService:
         """Filter content for keyword relevance."""
         
         relevant_content = []
+        automaton = _automaton_for(keywords)
+        
+        def has_keyword(text: str) -> bool:
+            # Stop at the first hit; the automaton yields matches lazily
+            return next(automaton.iter(text), None) is not None
         
         for content in content_list:
-            relevance_score = 0
-            content_text = (content.title + ' ' + content.content).lower()
-            
-            # Check keyword presence
-            for keyword in keywords:
-                if keyword.lower() in content_text:
-                    relevance_score += 1
-            
-            # Include if at least one keyword matches or has signals
-            if relevance_score > 0 or len(content.signals) > 0:
+            # Include if it has signals or at least one keyword matches; the
+            # cheap signals check goes first and the keyword scan stops early
+            if content.signals or (automaton is not None and (
+                has_keyword(content.title.lower()) or has_keyword(content.content_lower)
+            )):
                 relevant_content.append(content)
         
         return relevant_content
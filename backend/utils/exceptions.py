@@ -5,250 +5,364 @@ Provides comprehensive error handling with structured responses,
 logging, and proper HTTP status codes.
 """
 
+import logging
+import time
 import traceback
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional
 
+import orjson
 import structlog
 from fastapi import HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import ValidationError
 
 from backend.core.config import settings
+from backend.core.logging import correlation_id_var
 
 logger = structlog.get_logger(__name__)
 
+# Frames included in debug tracebacks
+TRACEBACK_LIMIT = 20
+
+# Production body for unexpected errors, identical on every request
+_GENERIC_500_ERROR = {
+    "code": "INTERNAL_SERVER_ERROR",
+    "message": "An unexpected error occurred",
+    "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+}
+_GENERIC_500_BODY = orjson.dumps({"error": _GENERIC_500_ERROR})
+# Same body with an open ``correlation_id`` member, closed per request
+_GENERIC_500_PREFIX = _GENERIC_500_BODY[:-1] + b',"correlation_id":'
+
+# Validation warnings logged per second; the rest are dropped
+VALIDATION_LOG_RATE = 100
+
+
+class _TokenBucket:
+    """Token bucket allowing up to ``rate`` events per ``per_sec`` seconds."""
+    
+    def __init__(self, rate: int, per_sec: float = 1.0):
+        self.rate = rate
+        self.per_sec = per_sec
+        self._tokens = float(rate)
+        self._last = time.monotonic()
+    
+    def allow(self) -> bool:
+        """Consume a token if one is available."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.rate, self._tokens + (now - self._last) * self.rate / self.per_sec
+        )
+        self._last = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+_validation_log_bucket = _TokenBucket(rate=VALIDATION_LOG_RATE)
+
+
+class ErrorResponse(ORJSONResponse):
+    """
+    orjson-encoded error response.
+    
+    Exception details may hold values orjson can't encode natively (e.g.
+    ``Decimal`` IDs or arbitrary objects), so those fall back to ``str``.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        """Serialize the error body, stringifying unsupported values."""
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
 
 class ConsultantPlatformException(Exception):
-    """Base exception for all application-specific errors."""
+    """
+    Base exception for all application-specific errors.
+    
+    ``error_code``, ``status_code`` and ``always_include_details`` are fixed
+    per subclass, so they live on the class; an instance only stores its own
+    code or status when one is passed explicitly.
+    """
+    
+    error_code: str = "GENERAL_ERROR"
+    status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+    # Whether responses carry ``details`` outside debug mode
+    always_include_details: ClassVar[bool] = False
     
     def __init__(
         self,
         message: str,
-        error_code: str = "GENERAL_ERROR",
-        status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
+        error_code: Optional[str] = None,
+        status_code: Optional[int] = None,
         details: Optional[Dict[str, Any]] = None,
         correlation_id: Optional[str] = None
     ):
         self.message = message
-        self.error_code = error_code
-        self.status_code = status_code
-        self.details = details or {}
+        if error_code is not None:
+            self.error_code = error_code
+        if status_code is not None:
+            self.status_code = status_code
+        self._details = details
         self.correlation_id = correlation_id
         super().__init__(self.message)
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        """
+        Structured error details for logs and responses.
+        
+        Subclasses keep their fields as attributes and assemble this dict
+        only when a handler reads it, not on every raise.
+        """
+        return self._details or {}
 
 
 class ValidationException(ConsultantPlatformException):
     """Exception for input validation errors."""
     
+    error_code = "VALIDATION_ERROR"
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    always_include_details = True
+    
     def __init__(
         self,
         message: str = "Validation error",
         field_errors: Optional[Dict[str, Any]] = None,
-        **kwargs
+        correlation_id: Optional[str] = None
     ):
         self.field_errors = field_errors or {}
-        super().__init__(
-            message=message,
-            error_code="VALIDATION_ERROR",
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            details={"field_errors": self.field_errors},
-            **kwargs
-        )
+        super().__init__(message=message, correlation_id=correlation_id)
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"field_errors": self.field_errors}
 
 
 class NotFoundError(ConsultantPlatformException):
     """Exception for resource not found errors."""
     
+    error_code = "RESOURCE_NOT_FOUND"
+    status_code = status.HTTP_404_NOT_FOUND
+    
     def __init__(
         self,
         resource: str,
         resource_id: Any = None,
-        **kwargs
+        correlation_id: Optional[str] = None
     ):
+        self.resource = resource
+        self.resource_id = resource_id
+        
         message = f"{resource} not found"
         if resource_id is not None:
             message += f" (ID: {resource_id})"
         
-        super().__init__(
-            message=message,
-            error_code="RESOURCE_NOT_FOUND",
-            status_code=status.HTTP_404_NOT_FOUND,
-            details={"resource": resource, "resource_id": resource_id},
-            **kwargs
-        )
+        super().__init__(message=message, correlation_id=correlation_id)
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"resource": self.resource, "resource_id": self.resource_id}
 
 
 class AuthenticationError(ConsultantPlatformException):
     """Exception for authentication errors."""
     
+    error_code = "AUTHENTICATION_ERROR"
+    status_code = status.HTTP_401_UNAUTHORIZED
+    
     def __init__(
         self,
         message: str = "Authentication failed",
-        **kwargs
+        correlation_id: Optional[str] = None
     ):
         super().__init__(
             message=message,
-            error_code="AUTHENTICATION_ERROR",
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            **kwargs
+            correlation_id=correlation_id
         )
 
 
 class AuthorizationError(ConsultantPlatformException):
     """Exception for authorization errors."""
     
+    error_code = "AUTHORIZATION_ERROR"
+    status_code = status.HTTP_403_FORBIDDEN
+    
     def __init__(
         self,
         message: str = "Access denied",
         resource: Optional[str] = None,
         action: Optional[str] = None,
-        **kwargs
+        correlation_id: Optional[str] = None
     ):
-        super().__init__(
-            message=message,
-            error_code="AUTHORIZATION_ERROR",
-            status_code=status.HTTP_403_FORBIDDEN,
-            details={"resource": resource, "action": action},
-            **kwargs
-        )
+        self.resource = resource
+        self.action = action
+        super().__init__(message=message, correlation_id=correlation_id)
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"resource": self.resource, "action": self.action}
 
 
 class RateLimitError(ConsultantPlatformException):
     """Exception for rate limiting errors."""
     
+    error_code = "RATE_LIMIT_EXCEEDED"
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+    
     def __init__(
         self,
         message: str = "Rate limit exceeded",
         limit: Optional[str] = None,
         reset_time: Optional[int] = None,
-        **kwargs
+        correlation_id: Optional[str] = None
     ):
-        super().__init__(
-            message=message,
-            error_code="RATE_LIMIT_EXCEEDED",
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            details={"limit": limit, "reset_time": reset_time},
-            **kwargs
-        )
+        self.limit = limit
+        self.reset_time = reset_time
+        super().__init__(message=message, correlation_id=correlation_id)
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"limit": self.limit, "reset_time": self.reset_time}
 
 
 class ExternalServiceError(ConsultantPlatformException):
     """Exception for external service errors."""
     
+    error_code = "EXTERNAL_SERVICE_ERROR"
+    status_code = status.HTTP_502_BAD_GATEWAY
+    
     def __init__(
         self,
         service: str,
         message: str = "External service error",
         service_status_code: Optional[int] = None,
-        **kwargs
+        correlation_id: Optional[str] = None
     ):
-        super().__init__(
-            message=f"{service}: {message}",
-            error_code="EXTERNAL_SERVICE_ERROR",
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            details={
-                "service": service,
-                "service_status_code": service_status_code,
-            },
-            **kwargs
-        )
+        self.service = service
+        self.service_status_code = service_status_code
+        super().__init__(message=f"{service}: {message}", correlation_id=correlation_id)
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {
+            "service": self.service,
+            "service_status_code": self.service_status_code,
+        }
 
 
 class BusinessLogicError(ConsultantPlatformException):
     """Exception for business logic violations."""
     
+    error_code = "BUSINESS_LOGIC_ERROR"
+    status_code = status.HTTP_400_BAD_REQUEST
+    
     def __init__(
         self,
         message: str,
         business_rule: Optional[str] = None,
-        **kwargs
+        correlation_id: Optional[str] = None
     ):
-        super().__init__(
-            message=message,
-            error_code="BUSINESS_LOGIC_ERROR",
-            status_code=status.HTTP_400_BAD_REQUEST,
-            details={"business_rule": business_rule},
-            **kwargs
-        )
+        self.business_rule = business_rule
+        super().__init__(message=message, correlation_id=correlation_id)
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"business_rule": self.business_rule}
 
 
 class DatabaseError(ConsultantPlatformException):
     """Exception for database-related errors."""
     
+    error_code = "DATABASE_ERROR"
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    
     def __init__(
         self,
         message: str = "Database error",
         operation: Optional[str] = None,
         table: Optional[str] = None,
-        **kwargs
+        correlation_id: Optional[str] = None
     ):
-        super().__init__(
-            message=message,
-            error_code="DATABASE_ERROR",
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            details={"operation": operation, "table": table},
-            **kwargs
-        )
+        self.operation = operation
+        self.table = table
+        super().__init__(message=message, correlation_id=correlation_id)
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"operation": self.operation, "table": self.table}
 
 
 class ConfigurationError(ConsultantPlatformException):
     """Exception for configuration errors."""
     
+    error_code = "CONFIGURATION_ERROR"
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    
     def __init__(
         self,
         message: str = "Configuration error",
         config_key: Optional[str] = None,
-        **kwargs
+        correlation_id: Optional[str] = None
     ):
-        super().__init__(
-            message=message,
-            error_code="CONFIGURATION_ERROR",
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            details={"config_key": config_key},
-            **kwargs
-        )
+        self.config_key = config_key
+        super().__init__(message=message, correlation_id=correlation_id)
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"config_key": self.config_key}
+
+
+def _log_enabled(level: int) -> bool:
+    """Whether a log call at ``level`` would be emitted."""
+    # Reason: the pinned structlog's filtering loggers can't be queried for
+    # their level; setup_logging() applies the same level to the root logger
+    return logging.getLogger().isEnabledFor(level)
 
 
 # Exception handlers
 async def consultant_platform_exception_handler(
     request: Request,
     exc: ConsultantPlatformException
-) -> JSONResponse:
+) -> ErrorResponse:
     """Handle application-specific exceptions."""
     
-    # Get correlation ID from request
-    correlation_id = getattr(request.state, 'correlation_id', None)
+    # Get correlation ID for the current request
+    correlation_id = correlation_id_var.get()
     
-    # Log the exception
-    logger.error(
-        "Application exception",
-        error_code=exc.error_code,
-        message=exc.message,
-        status_code=exc.status_code,
-        details=exc.details,
-        correlation_id=correlation_id,
-        exc_info=settings.debug
-    )
+    # Log the exception; skip building the payload when ERROR is filtered out
+    if _log_enabled(logging.ERROR):
+        logger.error(
+            "Application exception",
+            error_code=exc.error_code,
+            message=exc.message,
+            status_code=exc.status_code,
+            details=exc.details,
+            correlation_id=correlation_id,
+            exc_info=settings.debug
+        )
     
-    # Prepare response
+    # Prepare response, with details in debug mode or for classes that
+    # always expose them
     response_data = {
         "error": {
             "code": exc.error_code,
             "message": exc.message,
             "status_code": exc.status_code,
+            **(
+                {"details": exc.details}
+                if settings.debug or exc.always_include_details
+                else {}
+            ),
         }
     }
-    
-    # Add details in debug mode or for validation errors
-    if settings.debug or isinstance(exc, ValidationException):
-        response_data["error"]["details"] = exc.details
-    
+
     # Add correlation ID if available
     if correlation_id:
         response_data["correlation_id"] = correlation_id
     
-    return JSONResponse(
+    return ErrorResponse(
         status_code=exc.status_code,
         content=response_data
     )
@@ -257,22 +371,24 @@ async def consultant_platform_exception_handler(
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError
-) -> JSONResponse:
+) -> ErrorResponse:
     """Handle FastAPI validation errors."""
     
-    correlation_id = getattr(request.state, 'correlation_id', None)
+    correlation_id = correlation_id_var.get()
     
-    # Process validation errors
-    field_errors = {}
-    for error in exc.errors():
-        field_path = ".".join(str(loc) for loc in error["loc"][1:])  # Skip 'body'
-        field_errors[field_path] = error["msg"]
+    # Process validation errors, skipping the leading 'body'/'query' loc part
+    field_errors = {
+        ".".join(map(str, error["loc"][1:])): error["msg"]
+        for error in exc.errors()
+    }
     
-    logger.warning(
-        "Validation error",
-        field_errors=field_errors,
-        correlation_id=correlation_id
-    )
+    # Sampled so bot or fuzzing traffic can't flood the logs
+    if _log_enabled(logging.WARNING) and _validation_log_bucket.allow():
+        logger.warning(
+            "Validation error",
+            field_errors=field_errors,
+            correlation_id=correlation_id
+        )
     
     response_data = {
         "error": {
@@ -288,7 +404,7 @@ async def validation_exception_handler(
     if correlation_id:
         response_data["correlation_id"] = correlation_id
     
-    return JSONResponse(
+    return ErrorResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=response_data
     )
@@ -297,19 +413,25 @@ async def validation_exception_handler(
 async def http_exception_handler(
     request: Request,
     exc: Exception
-) -> JSONResponse:
+) -> Response:
     """Handle all other exceptions."""
     
-    correlation_id = getattr(request.state, 'correlation_id', None)
-    
+    # Reason: The Exception handler runs in ServerErrorMiddleware, outside the
+    # call_next task where the middleware set the ContextVar, so fall back to
+    # the value stored on request.state
+    correlation_id = correlation_id_var.get() or getattr(
+        request.state, "correlation_id", None
+    )
+
     # Handle HTTPException
     if isinstance(exc, HTTPException):
-        logger.warning(
-            "HTTP exception",
-            status_code=exc.status_code,
-            detail=exc.detail,
-            correlation_id=correlation_id
-        )
+        if _log_enabled(logging.WARNING):
+            logger.warning(
+                "HTTP exception",
+                status_code=exc.status_code,
+                detail=exc.detail,
+                correlation_id=correlation_id
+            )
         
         response_data = {
             "error": {
@@ -322,7 +444,7 @@ async def http_exception_handler(
         if correlation_id:
             response_data["correlation_id"] = correlation_id
         
-        return JSONResponse(
+        return ErrorResponse(
             status_code=exc.status_code,
             content=response_data
         )
@@ -345,23 +467,33 @@ async def http_exception_handler(
                 "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
                 "details": {
                     "exception_type": type(exc).__name__,
-                    "traceback": traceback.format_exc()
+                    # Capped so deep stacks don't walk every frame
+                    "traceback": "".join(
+                        traceback.TracebackException.from_exception(
+                            exc, limit=TRACEBACK_LIMIT, capture_locals=False
+                        ).format()
+                    )
                 }
             }
         }
     else:
-        response_data = {
-            "error": {
-                "code": "INTERNAL_SERVER_ERROR",
-                "message": "An unexpected error occurred",
-                "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
-            }
-        }
+        # Reason: Only the correlation ID varies, so splice its encoded
+        # string onto the precomputed body instead of re-serializing it
+        content = (
+            _GENERIC_500_PREFIX + orjson.dumps(correlation_id) + b"}"
+            if correlation_id
+            else _GENERIC_500_BODY
+        )
+        return Response(
+            content=content,
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            media_type="application/json"
+        )
     
     if correlation_id:
         response_data["correlation_id"] = correlation_id
     
-    return JSONResponse(
+    return ErrorResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=response_data
     )
@@ -0,0 +1,53 @@
+"""Tests for the single-pass JSON body dependency."""
+
+from typing import Optional
+
+from fastapi import Depends, FastAPI
+from fastapi.exceptions import RequestValidationError
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+
+from backend.api.dependencies import json_body
+from backend.models.schemas.consultant import JsonInputMixin
+from backend.utils.exceptions import validation_exception_handler
+
+
+class _Payload(BaseModel, JsonInputMixin):
+    name: str = Field(..., min_length=1)
+    seats: Optional[int] = None
+
+
+app = FastAPI()
+app.add_exception_handler(RequestValidationError, validation_exception_handler)
+
+
+@app.post("/payloads")
+async def create_payload(payload: _Payload = Depends(json_body(_Payload))) -> dict:
+    return payload.model_dump()
+
+
+client = TestClient(app)
+
+
+def test_valid_body_is_parsed():
+    response = client.post("/payloads", content=b'{"name": "Acme", "seats": 3}')
+
+    assert response.status_code == 200
+    assert response.json() == {"name": "Acme", "seats": 3}
+
+
+def test_field_errors_are_keyed_by_field_path():
+    response = client.post("/payloads", content=b'{"name": "", "seats": "many"}')
+
+    assert response.status_code == 422
+    error = response.json()["error"]
+    assert error["code"] == "VALIDATION_ERROR"
+    # The leading "body" loc part is stripped, as for FastAPI's own body errors
+    assert set(error["details"]["field_errors"]) == {"name", "seats"}
+
+
+def test_malformed_json_is_a_validation_error():
+    response = client.post("/payloads", content=b'{"name": ')
+
+    assert response.status_code == 422
+    assert response.json()["error"]["code"] == "VALIDATION_ERROR"
@@ -0,0 +1,107 @@
+"""Tests for the in-process LLM response caches."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from backend.services import llm_cache
+from backend.services.llm_cache import ExactCache, SemanticCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the caches' monotonic clock with a manually advanced one."""
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def _unit(*values: float) -> np.ndarray:
+    return SemanticCache.normalize(list(values))
+
+
+class TestExactCache:
+    def test_returns_stored_value(self, clock):
+        cache = ExactCache()
+        key = ExactCache.make_key("gpt-4o", [{"role": "user", "content": "hi"}], 0.3, 100)
+
+        cache.set(key, "response")
+
+        assert cache.get(key) == "response"
+
+    def test_entry_expires_after_ttl(self, clock):
+        cache = ExactCache(ttl_seconds=60)
+        cache.set("key", "response")
+
+        clock[0] += 60
+        assert cache.get("key") == "response"
+
+        clock[0] += 1
+        assert cache.get("key") is None
+
+    def test_evicts_least_recently_used_entry(self, clock):
+        cache = ExactCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Reading "a" makes "b" the least recently used
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_missing_key_returns_none(self, clock):
+        assert ExactCache().get("missing") is None
+
+    def test_make_key_separates_scopes(self):
+        messages = [{"role": "system", "content": "Analyze the signal."}]
+
+        acme = ExactCache.make_key("gpt-4o-mini", messages, 0.2, 500, scope="Acme")
+        globex = ExactCache.make_key("gpt-4o-mini", messages, 0.2, 500, scope="Globex")
+
+        assert acme != globex
+        assert acme == ExactCache.make_key("gpt-4o-mini", messages, 0.2, 500, scope="Acme")
+
+
+class TestSemanticCache:
+    def test_similar_prompt_hits(self, clock):
+        cache = SemanticCache(threshold=0.9)
+        cache.insert("ns", _unit(1.0, 0.0), "response")
+
+        assert cache.lookup("ns", _unit(1.0, 0.1)) == "response"
+
+    def test_dissimilar_prompt_misses(self, clock):
+        cache = SemanticCache(threshold=0.9)
+        cache.insert("ns", _unit(1.0, 0.0), "response")
+
+        assert cache.lookup("ns", _unit(1.0, 1.0)) is None
+
+    def test_other_namespace_misses(self, clock):
+        cache = SemanticCache(threshold=0.9)
+        cache.insert("acme", _unit(1.0, 0.0), "response")
+
+        assert cache.lookup("globex", _unit(1.0, 0.0)) is None
+
+    def test_expired_entry_misses(self, clock):
+        cache = SemanticCache(threshold=0.9, ttl_seconds=60)
+        cache.insert("ns", _unit(1.0, 0.0), "response")
+
+        clock[0] += 61
+
+        assert cache.lookup("ns", _unit(1.0, 0.0)) is None
+
+    def test_oldest_entry_dropped_when_full(self, clock):
+        cache = SemanticCache(threshold=0.99, max_entries=2)
+        cache.insert("ns", _unit(1.0, 0.0, 0.0), "first")
+        cache.insert("ns", _unit(0.0, 1.0, 0.0), "second")
+        cache.insert("ns", _unit(0.0, 0.0, 1.0), "third")
+
+        assert cache.lookup("ns", _unit(1.0, 0.0, 0.0)) is None
+        assert cache.lookup("ns", _unit(0.0, 1.0, 0.0)) == "second"
+        assert cache.lookup("ns", _unit(0.0, 0.0, 1.0)) == "third"
+
+    def test_normalize_leaves_zero_vector(self):
+        assert not SemanticCache.normalize([0.0, 0.0]).any()
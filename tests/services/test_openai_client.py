@@ -0,0 +1,159 @@
+"""Tests for retry backoff and request coalescing in the chat completion client."""
+
+import asyncio
+from typing import Optional
+
+import httpx
+import openai
+import pytest
+from pydantic import BaseModel
+
+from backend.services import openai_client
+from backend.services.openai_client import MAX_BACKOFF_SECONDS, ChatCompletionClient, backoff_delay
+
+MESSAGES = [{"role": "user", "content": "Summarize Acme's funding news."}]
+
+
+class _Response(BaseModel):
+    """Stand-in for a chat completion; the client only copies and returns it."""
+
+    content: str
+    usage: Optional[int] = None
+
+
+def _rate_limit_error(headers: dict) -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, headers=headers, request=request)
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+@pytest.fixture
+def chat(monkeypatch):
+    """Client whose API fetch is replaced per test through ``chat.fetch``."""
+    # Reason: token counting needs tiktoken's encodings, which is beside the point here
+    monkeypatch.setattr(openai_client, "output_token_budget", lambda model, messages, requested: requested)
+    client = ChatCompletionClient(client=None, max_concurrency=4, semantic_cache_threshold=0.9)
+    client.fetch_calls = 0
+
+    async def fake_fetch(*args, **kwargs):
+        client.fetch_calls += 1
+        return await client.fetch(client.fetch_calls)
+
+    monkeypatch.setattr(client, "_fetch_completion", fake_fetch)
+    return client
+
+
+class TestBackoffDelay:
+    def test_without_hint_stays_within_jitter_range(self):
+        for attempt in range(3):
+            delay = backoff_delay(attempt, 1.0)
+            assert 1.0 <= delay <= 3 * (2 ** attempt)
+
+    def test_honours_retry_after_ms(self):
+        delay = backoff_delay(0, 0.01, _rate_limit_error({"retry-after-ms": "2500"}))
+
+        assert delay == pytest.approx(2.5)
+
+    def test_honours_retry_after_seconds(self):
+        delay = backoff_delay(0, 0.01, _rate_limit_error({"retry-after": "7"}))
+
+        assert delay == 7.0
+
+    def test_prefers_retry_after_ms(self):
+        error = _rate_limit_error({"retry-after-ms": "1500", "retry-after": "9"})
+
+        assert backoff_delay(0, 0.01, error) == pytest.approx(1.5)
+
+    def test_http_date_falls_back_to_backoff(self):
+        error = _rate_limit_error({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+        delay = backoff_delay(0, 1.0, error)
+
+        assert 1.0 <= delay <= 3.0
+
+    def test_caps_long_hints(self):
+        delay = backoff_delay(0, 1.0, _rate_limit_error({"retry-after": "3600"}))
+
+        assert delay == MAX_BACKOFF_SECONDS
+
+
+class TestRequestCoalescing:
+    async def test_identical_requests_share_one_fetch(self, chat):
+        release = asyncio.Event()
+
+        async def fetch(call):
+            await release.wait()
+            return _Response(content="summary", usage=42)
+
+        chat.fetch = fetch
+        leader = asyncio.create_task(chat.complete("gpt-4o", MESSAGES, temperature=0.3))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(chat.complete("gpt-4o", MESSAGES, temperature=0.3))
+        await asyncio.sleep(0)
+        release.set()
+
+        leader_response, follower_response = await asyncio.gather(leader, follower)
+
+        assert chat.fetch_calls == 1
+        assert leader_response.usage == 42
+        # The follower's tokens were already counted for the leader
+        assert follower_response.content == "summary"
+        assert follower_response.usage is None
+
+    async def test_creative_requests_are_not_coalesced(self, chat):
+        async def fetch(call):
+            await asyncio.sleep(0)
+            return _Response(content=f"draft {call}")
+
+        chat.fetch = fetch
+
+        responses = await asyncio.gather(
+            chat.complete("gpt-4o-mini", MESSAGES, temperature=0.7),
+            chat.complete("gpt-4o-mini", MESSAGES, temperature=0.7)
+        )
+
+        assert chat.fetch_calls == 2
+        assert {response.content for response in responses} == {"draft 1", "draft 2"}
+
+    async def test_follower_takes_over_when_leader_cancelled(self, chat):
+        async def fetch(call):
+            if call == 1:
+                await asyncio.Event().wait()
+            return _Response(content="summary", usage=42)
+
+        chat.fetch = fetch
+        leader = asyncio.create_task(chat.complete("gpt-4o", MESSAGES, temperature=0.3))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(chat.complete("gpt-4o", MESSAGES, temperature=0.3))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        response = await follower
+
+        assert leader.cancelled()
+        assert chat.fetch_calls == 2
+        # The follower sent the request itself, so it owns the usage
+        assert response.usage == 42
+        assert not chat._inflight
+
+    async def test_failure_reaches_every_waiter(self, chat):
+        release = asyncio.Event()
+
+        async def fetch(call):
+            await release.wait()
+            raise openai.APIConnectionError(
+                request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+            )
+
+        chat.fetch = fetch
+        leader = asyncio.create_task(chat.complete("gpt-4o", MESSAGES, temperature=0.3))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(chat.complete("gpt-4o", MESSAGES, temperature=0.3))
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(leader, follower, return_exceptions=True)
+
+        assert chat.fetch_calls == 1
+        assert all(isinstance(result, openai.APIConnectionError) for result in results)
+        assert not chat._inflight
@@ -0,0 +1,62 @@
+"""Tests for business signal detection in scraped content."""
+
+import pytest
+
+from backend.services.scraping_service import WebScrapingService
+
+
+@pytest.fixture
+def service():
+    return WebScrapingService()
+
+
+def _detect(service, content, keywords=(), target_type="news_article"):
+    return service._detect_signals(content, content.lower(), list(keywords), target_type)
+
+
+def test_pattern_signal_reports_match_and_sentence(service):
+    content = "Acme announced today. The company Raised $5.2M from investors. More soon."
+
+    signals = _detect(service, content)
+
+    funding = next(signal for signal in signals if signal["type"] == "funding")
+    assert funding["match"] == "raised $5.2m"
+    assert funding["pattern"] == r"raised \$[\d\.]+[mb]?"
+    # The decimal point inside the match doesn't end the sentence
+    assert funding["context"] == "The company Raised $5.2M from investors"
+
+
+def test_custom_keyword_context_uses_first_occurrence(service):
+    content = "We sell shoes. Our Kubernetes platform grows. More kubernetes later."
+
+    signals = _detect(service, content, keywords=["Kubernetes"])
+
+    assert signals == [{
+        "type": "custom",
+        "pattern": "Kubernetes",
+        "match": "Kubernetes",
+        "confidence": 0.7,
+        "context": "Our Kubernetes platform grows"
+    }]
+
+
+def test_repeated_matches_are_deduplicated(service):
+    content = "Seed funding closed. A second seed funding followed. Then seed funding again."
+
+    signals = _detect(service, content)
+
+    assert [signal["match"] for signal in signals] == ["seed funding"]
+
+
+def test_no_signals_in_unrelated_content(service):
+    assert _detect(service, "Nothing of note happened here.", keywords=["merger"]) == []
+
+
+def test_context_survives_lowercasing_length_change(service):
+    # "İ" lowercases to two code points, so offsets no longer line up with the original
+    content = "İstanbul office opened. We are hiring 40 people now."
+
+    signals = _detect(service, content)
+
+    hiring = next(signal for signal in signals if signal["type"] == "hiring")
+    assert hiring["context"] == "we are hiring 40 people now"